@@ -6,79 +6,132 @@ Deploys VPC, Lambda backup, and ASG infrastructure
 
 import sys
 import time
+import json
+import logging
+import os
 from vpc_infrastructure import VPCInfrastructure
 from deploy_lambda_backup import LambdaDeployment
-from asg_deployment import ASGDeployment
+from asg_deployment import UbuntuASGDeployment
+
+
+STATES_DIR = 'States'
+CHECKPOINT_FILE = os.path.join(STATES_DIR, 'deploy_checkpoint.json')
+VPC_STATE_FILE = os.path.join(STATES_DIR, 'VPC-Deploy-Info.json')
+ASG_STATE_FILE = os.path.join(STATES_DIR, 'Ubuntu-Backend-Deploy-Info.json')
+LAMBDA_STATE_FILE = os.path.join(STATES_DIR, 'Lambda-Backup-Deploy-Info.json')
+
+logger = logging.getLogger(__name__)
+
+
+def load_checkpoint():
+    """Load completed deployment steps from the checkpoint file"""
+    try:
+        with open(CHECKPOINT_FILE, 'r') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def save_checkpoint(checkpoint):
+    """Persist completed deployment steps to the checkpoint file"""
+    if not os.path.exists(STATES_DIR):
+        os.makedirs(STATES_DIR)
+    with open(CHECKPOINT_FILE, 'w') as f:
+        json.dump(checkpoint, f, indent=2)
 
 
 def main():
     """Deploy complete MERN infrastructure"""
-    print("🚀 Starting Complete MERN Infrastructure Deployment")
-    print("=" * 60)
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
+    logger.info("Starting Complete MERN Infrastructure Deployment")
+    logger.info("=" * 60)
+    
+    checkpoint = load_checkpoint()
     
     try:
         # Step 1: Deploy VPC Infrastructure
-        print("\n📋 Step 1: Deploying VPC Infrastructure...")
-        vpc_infra = VPCInfrastructure()
-        vpc_success = vpc_infra.deploy_infrastructure()
-        
-        if not vpc_success:
-            print("❌ VPC deployment failed! Stopping deployment.")
-            return False
+        logger.info("Step 1: Deploying VPC Infrastructure...")
+        infrastructure_info = {}
+        if checkpoint.get('vpc') and os.path.exists(VPC_STATE_FILE):
+            with open(VPC_STATE_FILE, 'r') as f:
+                infrastructure_info = json.load(f)
         
-        print("✅ VPC Infrastructure deployed successfully!")
+        if infrastructure_info.get('complete'):
+            logger.info("VPC already deployed (%s) - skipping", infrastructure_info.get('vpc_id'))
+        else:
+            vpc_infra = VPCInfrastructure()
+            vpc_success = vpc_infra.deploy_infrastructure()
+            
+            if not vpc_success:
+                logger.error("VPC deployment failed! Stopping deployment.")
+                return False
+            
+            with open(VPC_STATE_FILE, 'r') as f:
+                infrastructure_info = json.load(f)
+            checkpoint['vpc'] = True
+            save_checkpoint(checkpoint)
+            logger.info("VPC Infrastructure deployed successfully!")
         
         # Step 2: Deploy Lambda Backup Solution
-        print("\n📋 Step 2: Deploying Lambda Backup Solution...")
-        lambda_deployment = LambdaDeployment()
-        lambda_success = lambda_deployment.deploy_backup_solution()
-        
-        if not lambda_success:
-            print("❌ Lambda deployment failed! Continuing with ASG...")
+        logger.info("Step 2: Deploying Lambda Backup Solution...")
+        if checkpoint.get('lambda') and os.path.exists(LAMBDA_STATE_FILE):
+            logger.info("Lambda Backup Solution already deployed - skipping")
         else:
-            print("✅ Lambda Backup Solution deployed successfully!")
+            lambda_deployment = LambdaDeployment()
+            lambda_success = lambda_deployment.deploy_backup_solution()
+            
+            if not lambda_success:
+                logger.error("Lambda deployment failed! Continuing with ASG...")
+            else:
+                checkpoint['lambda'] = True
+                save_checkpoint(checkpoint)
+                logger.info("Lambda Backup Solution deployed successfully!")
         
         # Step 3: Deploy Backend ASG Infrastructure
-        print("\n📋 Step 3: Deploying Backend ASG Infrastructure...")
-        infrastructure_info = vpc_infra.get_infrastructure_info()
-        asg_deployment = ASGDeployment()
-        asg_success = asg_deployment.deploy_backend_infrastructure(infrastructure_info)
-        
-        if not asg_success:
-            print("❌ ASG deployment failed!")
-            return False
-        
-        print("✅ Backend ASG Infrastructure deployed successfully!")
+        logger.info("Step 3: Deploying Backend ASG Infrastructure...")
+        if checkpoint.get('asg') and os.path.exists(ASG_STATE_FILE):
+            logger.info("Backend ASG Infrastructure already deployed - skipping")
+        else:
+            asg_deployment = UbuntuASGDeployment()
+            asg_success = asg_deployment.deploy_ubuntu_backend_infrastructure(infrastructure_info)
+            
+            if not asg_success:
+                logger.error("ASG deployment failed!")
+                return False
+            
+            checkpoint['asg'] = True
+            save_checkpoint(checkpoint)
+            logger.info("Backend ASG Infrastructure deployed successfully!")
         
         # Summary
-        print("\n" + "=" * 60)
-        print("🎉 COMPLETE INFRASTRUCTURE DEPLOYMENT SUCCESSFUL!")
-        print("=" * 60)
+        logger.info("=" * 60)
+        logger.info("COMPLETE INFRASTRUCTURE DEPLOYMENT SUCCESSFUL!")
+        logger.info("=" * 60)
         
-        print("\n📊 Deployment Summary:")
-        print("✅ VPC with public/private subnets")
-        print("✅ Security groups for all services")
-        print("✅ Internet Gateway and NAT Gateway")
-        print("✅ Auto Scaling Group for backend services")
-        print("✅ Application Load Balancer")
-        print("✅ Lambda function for MongoDB backups")
-        print("✅ S3 bucket for backup storage")
-        print("✅ CloudWatch monitoring and scaling")
+        logger.info("Deployment Summary:")
+        logger.info("   - VPC with public/private subnets")
+        logger.info("   - Security groups for all services")
+        logger.info("   - Internet Gateway and NAT Gateway")
+        logger.info("   - Auto Scaling Group for backend services")
+        logger.info("   - Application Load Balancer")
+        logger.info("   - Lambda function for MongoDB backups")
+        logger.info("   - S3 bucket for backup storage")
+        logger.info("   - CloudWatch monitoring and scaling")
         
-        print("\n🔗 Next Steps:")
-        print("1. Wait 5-10 minutes for ASG instances to be ready")
-        print("2. Test backend services via ALB DNS")
-        print("3. Deploy frontend using Kubernetes (EKS)")
-        print("4. Configure Route 53 DNS (optional)")
-        print("5. Set up SSL certificates (optional)")
+        logger.info("Next Steps:")
+        logger.info("   1. Wait 5-10 minutes for ASG instances to be ready")
+        logger.info("   2. Test backend services via ALB DNS")
+        logger.info("   3. Deploy frontend using Kubernetes (EKS)")
+        logger.info("   4. Configure Route 53 DNS (optional)")
+        logger.info("   5. Set up SSL certificates (optional)")
         
         return True
         
     except KeyboardInterrupt:
-        print("\n❌ Deployment interrupted by user")
+        logger.error("Deployment interrupted by user")
         return False
     except Exception as e:
-        print(f"\n❌ Unexpected error during deployment: {e}")
+        logger.error("Unexpected error during deployment: %s", e)
         return False
 
 
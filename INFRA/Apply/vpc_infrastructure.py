@@ -6,70 +6,264 @@ Creates VPC, subnets, security groups, and networking components
 
 import boto3
 import json
-from botocore.exceptions import ClientError
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+
+
+STATES_DIR = 'States'
+
+logger = logging.getLogger(__name__)
+
+# Tags shared by every resource this module creates
+_PROJECT_TAGS = [{'Key': 'Project', 'Value': 'MERN-Microservices'}]
+
+
+SECURITY_GROUP_CONFIGS = [
+    {
+        'name': 'MERN-ALB-SG',
+        'description': 'Security group for Application Load Balancer'
+    },
+    {
+        'name': 'MERN-Frontend-SG',
+        'description': 'Security group for Frontend instances'
+    },
+    {
+        'name': 'MERN-Backend-SG',
+        'description': 'Security group for Backend instances with internet and ALB access'
+    }
+]
+
+# Default allow-all egress rule of a new security group
+DEFAULT_EGRESS_RULE = {'IpProtocol': '-1', 'IpRanges': [{'CidrIp': '0.0.0.0/0'}]}
+
+# Backend outbound rules for Cloud MongoDB and external APIs
+BACKEND_EGRESS_RULES = [
+    {
+        'IpProtocol': 'tcp',
+        'FromPort': 443,
+        'ToPort': 443,
+        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS for Cloud MongoDB and APIs'}]
+    },
+    {
+        'IpProtocol': 'tcp',
+        'FromPort': 80,
+        'ToPort': 80,
+        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP for package downloads'}]
+    },
+    {
+        'IpProtocol': 'tcp',
+        'FromPort': 27017,
+        'ToPort': 27017,
+        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'MongoDB Atlas/Cloud access'}]
+    },
+    {
+        'IpProtocol': 'tcp',
+        'FromPort': 53,
+        'ToPort': 53,
+        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'DNS TCP'}]
+    },
+    {
+        'IpProtocol': 'udp',
+        'FromPort': 53,
+        'ToPort': 53,
+        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'DNS UDP'}]
+    }
+]
+
+
+def _tagspec(resource_type, name, **tags):
+    """Build an on-create TagSpecification with the Name and project tags"""
+    return {
+        'ResourceType': resource_type,
+        'Tags': [{'Key': 'Name', 'Value': name}] + _PROJECT_TAGS + [{'Key': key, 'Value': value} for key, value in tags.items()]
+    }
+
+# Subnet layout inside the 10.0.0.0/16 VPC, one public and one private subnet per AZ
+DEFAULT_TOPOLOGY = {
+    'public_cidrs': ['10.0.1.0/24', '10.0.2.0/24'],
+    'private_cidrs': ['10.0.11.0/24', '10.0.12.0/24']
+}
+
+# Interface endpoints that replace the NAT Gateway for SSM, EC2 and ECR traffic
+INTERFACE_ENDPOINT_SERVICES = ['ssm', 'ssmmessages', 'ec2messages', 'ec2', 'ecr.api', 'ecr.dkr']
+
+# describe call, result key, ID key and VPC filter used to look up existing resources by Name tag
+_EXISTING_LOOKUPS = {
+    'vpc': ('describe_vpcs', 'Vpcs', 'VpcId', None),
+    'internet-gateway': ('describe_internet_gateways', 'InternetGateways', 'InternetGatewayId', 'attachment.vpc-id'),
+    'subnet': ('describe_subnets', 'Subnets', 'SubnetId', 'vpc-id'),
+    'security-group': ('describe_security_groups', 'SecurityGroups', 'GroupId', 'vpc-id'),
+    'route-table': ('describe_route_tables', 'RouteTables', 'RouteTableId', 'vpc-id'),
+    'natgateway': ('describe_nat_gateways', 'NatGateways', 'NatGatewayId', 'vpc-id')
+}
+
+# Availability zones rarely change, cached describe results are reused for 30 days
+AZ_CACHE_TTL = 30 * 24 * 60 * 60
 
 
 class VPCInfrastructure:
-    def __init__(self, region='ap-south-1'):
+    def __init__(self, region='ap-south-1', az_names=None, use_nat_gateway=True, topology=None):
         self.region = region
-        self.ec2 = boto3.client('ec2', region_name=region)
+        # A topology with 'azs' skips the availability zone lookup entirely
+        self.topology = {**DEFAULT_TOPOLOGY, **(topology or {})}
+        self.az_names = self.topology.get('azs') or az_names
+        self.use_nat_gateway = use_nat_gateway
+        # One long-lived session and pooled client, shared by the concurrent calls;
+        # the session is exposed so other modules can build clients from it
+        self.session = boto3.Session()
+        self.client_config = Config(
+            region_name=region,
+            max_pool_connections=32,
+            retries={'mode': 'adaptive', 'max_attempts': 10},
+            tcp_keepalive=True,
+            user_agent_extra='mern-vpc/1.0'
+        )
+        self.ec2 = self.session.client('ec2', config=self.client_config)
         self.vpc_id = None
         self.public_subnets = []
         self.private_subnets = []
         self.internet_gateway_id = None
         self.nat_gateway_id = None
+        self.vpc_endpoints = []
+        self.security_groups = {}
+        self.route_tables = {}
+        self._nat_future = None
+        self._checkpoint_lock = threading.Lock()
         
+        # Resume a partially completed deployment
+        self._state_path = os.path.join(STATES_DIR, 'VPC-Deploy-Info.json')
+        self._load_checkpoint()
+        
+        # Warm DNS and the TLS session in the pool so create_vpc does not pay for them
+        threading.Thread(target=self._warm_connection, daemon=True).start()
+        
+    def _warm_connection(self):
+        """Issue one cheap EC2 call to open a pooled connection"""
+        try:
+            self.ec2.describe_regions(RegionNames=[self.region])
+        except (BotoCoreError, ClientError):
+            # Warming is best effort; real calls report their own errors
+            pass
+    
+    def _load_checkpoint(self):
+        """Rehydrate resource IDs saved by a previous run"""
+        try:
+            with open(self._state_path, 'r') as f:
+                state = json.load(f)
+        except (OSError, ValueError):
+            return
+        
+        if state.get('region') != self.region:
+            return
+        
+        self.vpc_id = state.get('vpc_id')
+        self.public_subnets = state.get('public_subnets') or []
+        self.private_subnets = state.get('private_subnets') or []
+        self.internet_gateway_id = state.get('internet_gateway_id')
+        self.nat_gateway_id = state.get('nat_gateway_id')
+        self.vpc_endpoints = state.get('vpc_endpoints') or []
+        self.security_groups = state.get('security_groups') or {}
+        self.route_tables = state.get('route_tables') or {}
+        
+        if self.vpc_id:
+            logger.info("Resuming from '%s' (VPC %s)", self._state_path, self.vpc_id)
+    
+    def _checkpoint(self, complete=False):
+        """Atomically save the resource IDs created so far"""
+        os.makedirs(STATES_DIR, exist_ok=True)
+        
+        # Consumers only use the file once the whole deployment has finished
+        output_data = {
+            **self.get_infrastructure_info(),
+            'security_groups': self.security_groups,
+            'route_tables': self.route_tables,
+            'complete': complete
+        }
+        
+        # The background NAT Gateway provisioning checkpoints too
+        with self._checkpoint_lock:
+            temp_path = f"{self._state_path}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(output_data, f, indent=2)
+            os.replace(temp_path, self._state_path)
+    
+    def _find_existing(self, resource, name_tag):
+        """Return the ID of a resource of this deployment with the given Name tag, or None"""
+        method, result_key, id_key, vpc_filter = _EXISTING_LOOKUPS[resource]
+        filters = [{'Name': 'tag:Name', 'Values': [name_tag]}]
+        if vpc_filter:
+            filters.append({'Name': vpc_filter, 'Values': [self.vpc_id]})
+        if resource == 'natgateway':
+            # Deleted NAT Gateways stay visible for a while, and the parameter is singular
+            filters.append({'Name': 'state', 'Values': ['available']})
+            response = self.ec2.describe_nat_gateways(Filter=filters)
+        else:
+            response = getattr(self.ec2, method)(Filters=filters)
+        
+        matches = response[result_key]
+        if not matches:
+            return None
+        
+        logger.info("Reusing existing %s '%s': %s", resource, name_tag, matches[0][id_key])
+        return matches[0][id_key]
+    
     def create_vpc(self, vpc_cidr='10.0.0.0/16', vpc_name='MERN-VPC'):
         """Create VPC with specified CIDR block"""
+        if self.vpc_id:
+            logger.info("Reusing VPC: %s", self.vpc_id)
+            return self.vpc_id
+        
         try:
+            self.vpc_id = self._find_existing('vpc', vpc_name)
+            if self.vpc_id:
+                return self.vpc_id
+            
             response = self.ec2.create_vpc(
-                CidrBlock=vpc_cidr
+                CidrBlock=vpc_cidr,
+                TagSpecifications=[_tagspec('vpc', vpc_name, Environment='Development')]
             )
             self.vpc_id = response['Vpc']['VpcId']
             
-            # Enable DNS hostnames and support separately
-            self.ec2.modify_vpc_attribute(
-                VpcId=self.vpc_id,
-                EnableDnsHostnames={'Value': True}
-            )
-            
-            self.ec2.modify_vpc_attribute(
-                VpcId=self.vpc_id,
-                EnableDnsSupport={'Value': True}
-            )
-            
-            # Tag the VPC
-            self.ec2.create_tags(
-                Resources=[self.vpc_id],
-                Tags=[
-                    {'Key': 'Name', 'Value': vpc_name},
-                    {'Key': 'Project', 'Value': 'MERN-Microservices'},
-                    {'Key': 'Environment', 'Value': 'Development'}
-                ]
-            )
+            # Enable DNS hostnames and support separately (one attribute per call),
+            # both calls are independent so they run concurrently
+            dns_attributes = [
+                {'EnableDnsHostnames': {'Value': True}},
+                {'EnableDnsSupport': {'Value': True}}
+            ]
+            with ThreadPoolExecutor(max_workers=len(dns_attributes)) as executor:
+                list(executor.map(
+                    lambda attribute: self.ec2.modify_vpc_attribute(VpcId=self.vpc_id, **attribute),
+                    dns_attributes
+                ))
             
-            print(f"✅ VPC created successfully: {self.vpc_id}")
+            logger.info("VPC created successfully: %s", self.vpc_id)
             return self.vpc_id
             
         except ClientError as e:
-            print(f"❌ Error creating VPC: {e}")
+            logger.error("Error creating VPC: %s", e)
             return None
     
     def create_internet_gateway(self):
         """Create and attach Internet Gateway"""
+        if self.internet_gateway_id:
+            logger.info("Reusing Internet Gateway: %s", self.internet_gateway_id)
+            return self.internet_gateway_id
+        
         try:
-            # Create Internet Gateway
-            response = self.ec2.create_internet_gateway()
-            self.internet_gateway_id = response['InternetGateway']['InternetGatewayId']
+            self.internet_gateway_id = self._find_existing('internet-gateway', 'MERN-IGW')
+            if self.internet_gateway_id:
+                return self.internet_gateway_id
             
-            # Tag the Internet Gateway
-            self.ec2.create_tags(
-                Resources=[self.internet_gateway_id],
-                Tags=[
-                    {'Key': 'Name', 'Value': 'MERN-IGW'},
-                    {'Key': 'Project', 'Value': 'MERN-Microservices'}
-                ]
+            # Create Internet Gateway
+            response = self.ec2.create_internet_gateway(
+                TagSpecifications=[_tagspec('internet-gateway', 'MERN-IGW')]
             )
+            self.internet_gateway_id = response['InternetGateway']['InternetGatewayId']
             
             # Attach to VPC
             self.ec2.attach_internet_gateway(
@@ -77,127 +271,215 @@ class VPCInfrastructure:
                 VpcId=self.vpc_id
             )
             
-            print(f"✅ Internet Gateway created and attached: {self.internet_gateway_id}")
+            logger.info("Internet Gateway created and attached: %s", self.internet_gateway_id)
             return self.internet_gateway_id
             
         except ClientError as e:
-            print(f"❌ Error creating Internet Gateway: {e}")
+            logger.error("Error creating Internet Gateway: %s", e)
             return None
     
     def create_subnets(self):
         """Create public and private subnets across AZs"""
+        if self.public_subnets and self.private_subnets:
+            logger.info("Reusing subnets: %s", self.public_subnets + self.private_subnets)
+            return self.public_subnets, self.private_subnets
+        
         try:
-            # Get available AZs
-            azs = self.ec2.describe_availability_zones()['AvailabilityZones']
-            az_names = [az['ZoneName'] for az in azs[:2]]  # Use first 2 AZs
+            subnet_configs = self._subnet_configs()
             
-            subnet_configs = [
-                # Public Subnets
-                {'cidr': '10.0.1.0/24', 'az': az_names[0], 'type': 'public', 'name': 'MERN-Public-1'},
-                {'cidr': '10.0.2.0/24', 'az': az_names[1], 'type': 'public', 'name': 'MERN-Public-2'},
-                # Private Subnets
-                {'cidr': '10.0.11.0/24', 'az': az_names[0], 'type': 'private', 'name': 'MERN-Private-1'},
-                {'cidr': '10.0.12.0/24', 'az': az_names[1], 'type': 'private', 'name': 'MERN-Private-2'},
-            ]
+            # Subnets are independent, create them concurrently
+            with ThreadPoolExecutor(max_workers=len(subnet_configs)) as executor:
+                subnet_ids = list(executor.map(self._create_subnet, subnet_configs))
             
-            for config in subnet_configs:
-                response = self.ec2.create_subnet(
-                    VpcId=self.vpc_id,
-                    CidrBlock=config['cidr'],
-                    AvailabilityZone=config['az']
-                )
-                
-                subnet_id = response['Subnet']['SubnetId']
-                
-                # Tag subnet
-                self.ec2.create_tags(
-                    Resources=[subnet_id],
-                    Tags=[
-                        {'Key': 'Name', 'Value': config['name']},
-                        {'Key': 'Type', 'Value': config['type']},
-                        {'Key': 'Project', 'Value': 'MERN-Microservices'}
-                    ]
-                )
-                
-                # Enable auto-assign public IPs for public subnets
+            for config, subnet_id in zip(subnet_configs, subnet_ids):
                 if config['type'] == 'public':
-                    self.ec2.modify_subnet_attribute(
-                        SubnetId=subnet_id,
-                        MapPublicIpOnLaunch={'Value': True}
-                    )
                     self.public_subnets.append(subnet_id)
                 else:
                     self.private_subnets.append(subnet_id)
-                
-                print(f"✅ {config['type'].title()} subnet created: {subnet_id} in {config['az']}")
             
             return self.public_subnets, self.private_subnets
             
         except ClientError as e:
-            print(f"❌ Error creating subnets: {e}")
+            logger.error("Error creating subnets: %s", e)
             return None, None
     
-    def create_route_tables(self):
-        """Create and configure route tables"""
+    def _subnet_configs(self):
+        """Return the public and private subnet layout, one subnet of each type per AZ"""
+        public_cidrs = self.topology['public_cidrs']
+        private_cidrs = self.topology['private_cidrs']
+        
+        # Get available AZs
+        az_names = self._get_azs()[:len(public_cidrs)]
+        
+        configs = []
+        for subnet_type, cidrs in (('public', public_cidrs), ('private', private_cidrs)):
+            for index, (cidr, az) in enumerate(zip(cidrs, az_names), start=1):
+                configs.append({
+                    'cidr': cidr,
+                    'az': az,
+                    'type': subnet_type,
+                    'name': f'MERN-{subnet_type.title()}-{index}'
+                })
+        return configs
+    
+    def _get_azs(self):
+        """Return availability zone names, from the constructor, the cache or EC2"""
+        if self.az_names:
+            return self.az_names
+        
+        cache_file = os.path.join(STATES_DIR, f'az-cache-{self.region}.json')
         try:
-            # Create public route table
-            public_rt_response = self.ec2.create_route_table(VpcId=self.vpc_id)
-            public_rt_id = public_rt_response['RouteTable']['RouteTableId']
-            
-            # Tag public route table
-            self.ec2.create_tags(
-                Resources=[public_rt_id],
-                Tags=[
-                    {'Key': 'Name', 'Value': 'MERN-Public-RT'},
-                    {'Key': 'Type', 'Value': 'Public'}
-                ]
-            )
-            
-            # Add route to Internet Gateway
-            self.ec2.create_route(
-                RouteTableId=public_rt_id,
-                DestinationCidrBlock='0.0.0.0/0',
-                GatewayId=self.internet_gateway_id
+            if time.time() - os.path.getmtime(cache_file) < AZ_CACHE_TTL:
+                with open(cache_file, 'r') as f:
+                    self.az_names = json.load(f)
+                return self.az_names
+        except (OSError, ValueError):
+            pass  # Missing or unreadable cache, describe instead
+        
+        azs = self.ec2.describe_availability_zones()['AvailabilityZones']
+        self.az_names = [az['ZoneName'] for az in azs]
+        
+        os.makedirs(STATES_DIR, exist_ok=True)
+        with open(cache_file, 'w') as f:
+            json.dump(self.az_names, f, indent=2)
+        
+        return self.az_names
+    
+    def _create_subnet(self, config):
+        """Create and tag a single subnet"""
+        subnet_id = self._find_existing('subnet', config['name'])
+        if subnet_id:
+            return subnet_id
+        
+        response = self.ec2.create_subnet(
+            VpcId=self.vpc_id,
+            CidrBlock=config['cidr'],
+            AvailabilityZone=config['az'],
+            TagSpecifications=[_tagspec('subnet', config['name'], Type=config['type'])]
+        )
+        
+        subnet_id = response['Subnet']['SubnetId']
+        
+        # Enable auto-assign public IPs for public subnets
+        if config['type'] == 'public':
+            self.ec2.modify_subnet_attribute(
+                SubnetId=subnet_id,
+                MapPublicIpOnLaunch={'Value': True}
             )
-            
-            # Associate public subnets with public route table
-            for subnet_id in self.public_subnets:
-                self.ec2.associate_route_table(
-                    RouteTableId=public_rt_id,
-                    SubnetId=subnet_id
-                )
-            
-            print(f"✅ Public route table created and configured: {public_rt_id}")
-            
-            # Create NAT Gateway (optional - for private subnet internet access)
-            # Allocate Elastic IP for NAT Gateway
-            eip_response = self.ec2.allocate_address(Domain='vpc')
-            allocation_id = eip_response['AllocationId']
-            
-            # Create NAT Gateway in first public subnet
+        
+        logger.info("%s subnet created: %s in %s", config['type'].title(), subnet_id, config['az'])
+        return subnet_id
+    
+    def allocate_nat_address(self):
+        """Allocate Elastic IP for NAT Gateway"""
+        eip_response = self.ec2.allocate_address(
+            Domain='vpc',
+            TagSpecifications=[_tagspec('elastic-ip', 'MERN-NAT-EIP')]
+        )
+        return eip_response['AllocationId']
+    
+    def release_nat_address(self, allocation_future):
+        """Release a NAT Elastic IP that will not be used"""
+        try:
+            self.ec2.release_address(AllocationId=allocation_future.result())
+        except ClientError:
+            pass
+    
+    def start_nat_gateway(self, allocation_future=None):
+        """Create NAT Gateway without waiting for it to become available"""
+        if allocation_future is not None:
+            allocation_id = allocation_future.result()
+        else:
+            allocation_id = self.allocate_nat_address()
+        
+        # Create NAT Gateway in first public subnet
+        try:
             nat_response = self.ec2.create_nat_gateway(
                 SubnetId=self.public_subnets[0],
-                AllocationId=allocation_id
+                AllocationId=allocation_id,
+                TagSpecifications=[_tagspec('natgateway', 'MERN-NAT')]
             )
-            self.nat_gateway_id = nat_response['NatGateway']['NatGatewayId']
+        except ClientError:
+            self.ec2.release_address(AllocationId=allocation_id)
+            raise
+        
+        # Record the NAT Gateway right away so a failed run can resume or destroy it
+        self.nat_gateway_id = nat_response['NatGateway']['NatGatewayId']
+        self._checkpoint()
+        
+        return self.nat_gateway_id
+    
+    def wait_for_nat_gateway(self):
+        """Wait until the NAT Gateway is available"""
+        # Poll every 5s instead of the default 15s
+        logger.info("Waiting for NAT Gateway to become available...")
+        waiter = self.ec2.get_waiter('nat_gateway_available')
+        waiter.wait(
+            NatGatewayIds=[self.nat_gateway_id],
+            WaiterConfig={'Delay': 5, 'MaxAttempts': 120}
+        )
+    
+    def create_route_tables(self):
+        """Create and configure route tables"""
+        if self.route_tables.get('public') and self.route_tables.get('private'):
+            logger.info("Reusing route tables: %s, %s", self.route_tables['public'], self.route_tables['private'])
+            return self.route_tables['public'], self.route_tables['private']
+        
+        try:
+            # Route tables found by name were fully configured by the run that created them,
+            # so each one is reused on its own and only a missing one is created
+            public_rt_id = self.route_tables.get('public') or self._find_existing('route-table', 'MERN-Public-RT')
+            if not public_rt_id:
+                public_rt_id = self._create_public_route_table()
             
-            # Wait for NAT Gateway to be available
-            print("⏳ Waiting for NAT Gateway to become available...")
-            waiter = self.ec2.get_waiter('nat_gateway_available')
-            waiter.wait(NatGatewayIds=[self.nat_gateway_id])
+            private_rt_id = self.route_tables.get('private') or self._find_existing('route-table', 'MERN-Private-RT')
+            if not private_rt_id:
+                private_rt_id = self._create_private_route_table()
             
-            # Create private route table
-            private_rt_response = self.ec2.create_route_table(VpcId=self.vpc_id)
-            private_rt_id = private_rt_response['RouteTable']['RouteTableId']
+            self.route_tables = {'public': public_rt_id, 'private': private_rt_id}
+            return public_rt_id, private_rt_id
             
-            # Tag private route table
-            self.ec2.create_tags(
-                Resources=[private_rt_id],
-                Tags=[
-                    {'Key': 'Name', 'Value': 'MERN-Private-RT'},
-                    {'Key': 'Type', 'Value': 'Private'}
-                ]
-            )
+        except (ClientError, WaiterError) as e:
+            logger.error("Error creating route tables: %s", e)
+            return None, None
+    
+    def _create_public_route_table(self):
+        """Create the public route table with its Internet Gateway route"""
+        public_rt_response = self.ec2.create_route_table(
+            VpcId=self.vpc_id,
+            TagSpecifications=[_tagspec('route-table', 'MERN-Public-RT', Type='Public')]
+        )
+        public_rt_id = public_rt_response['RouteTable']['RouteTableId']
+        
+        # Add route to Internet Gateway
+        self.ec2.create_route(
+            RouteTableId=public_rt_id,
+            DestinationCidrBlock='0.0.0.0/0',
+            GatewayId=self.internet_gateway_id
+        )
+        
+        # Associate public subnets with public route table
+        self._associate_subnets(public_rt_id, self.public_subnets)
+        
+        logger.info("Public route table created and configured: %s", public_rt_id)
+        return public_rt_id
+    
+    def _create_private_route_table(self):
+        """Create the private route table, routed through the NAT Gateway or VPC endpoints"""
+        private_rt_response = self.ec2.create_route_table(
+            VpcId=self.vpc_id,
+            TagSpecifications=[_tagspec('route-table', 'MERN-Private-RT', Type='Private')]
+        )
+        private_rt_id = private_rt_response['RouteTable']['RouteTableId']
+        
+        if self.use_nat_gateway:
+            # NAT Gateway (optional - for private subnet internet access) is only
+            # needed from here on; join the background provisioning if one was started
+            if self._nat_future is not None:
+                self.nat_gateway_id = self._nat_future.result()
+            elif not self.nat_gateway_id:
+                self.nat_gateway_id = self.start_nat_gateway()
+            self.wait_for_nat_gateway()
             
             # Add route to NAT Gateway
             self.ec2.create_route(
@@ -205,223 +487,246 @@ class VPCInfrastructure:
                 DestinationCidrBlock='0.0.0.0/0',
                 NatGatewayId=self.nat_gateway_id
             )
+        else:
+            self.create_vpc_endpoints(private_rt_id)
+        
+        # Associate private subnets with private route table
+        self._associate_subnets(private_rt_id, self.private_subnets)
+        
+        logger.info("Private route table created and configured: %s", private_rt_id)
+        if self.use_nat_gateway:
+            logger.info("NAT Gateway created: %s", self.nat_gateway_id)
+        return private_rt_id
+    
+    def create_vpc_endpoints(self, private_rt_id):
+        """Create S3 gateway and SSM/EC2/ECR interface endpoints for the private subnets"""
+        # Interface endpoints accept HTTPS from the frontend and backend instances
+        endpoint_sg_id = self._create_security_group({
+            'name': 'MERN-Endpoint-SG',
+            'description': 'Security group for VPC interface endpoints'
+        })
+        try:
+            self.ec2.authorize_security_group_ingress(
+                GroupId=endpoint_sg_id,
+                IpPermissions=[{
+                    'IpProtocol': 'tcp',
+                    'FromPort': 443,
+                    'ToPort': 443,
+                    'UserIdGroupPairs': [
+                        {'GroupId': self.security_groups['MERN-Frontend-SG'], 'Description': 'HTTPS from Frontend'},
+                        {'GroupId': self.security_groups['MERN-Backend-SG'], 'Description': 'HTTPS from Backend'}
+                    ]
+                }]
+            )
+        except ClientError as e:
+            # A resumed deployment reuses the group together with its rule
+            if e.response['Error']['Code'] != 'InvalidPermission.Duplicate':
+                raise
+        
+        # Endpoints left by an earlier run, by service name; a second interface
+        # endpoint with private DNS for the same service would be rejected
+        existing = {
+            endpoint['ServiceName']: endpoint
+            for endpoint in self.ec2.describe_vpc_endpoints(
+                Filters=[
+                    {'Name': 'vpc-id', 'Values': [self.vpc_id]},
+                    {'Name': 'vpc-endpoint-state', 'Values': ['pendingAcceptance', 'pending', 'available']}
+                ]
+            )['VpcEndpoints']
+        }
+        
+        def create_endpoint(service):
+            service_name = f'com.amazonaws.{self.region}.{service}'
+            endpoint = existing.get(service_name)
+            if endpoint:
+                logger.info("Reusing existing VPC endpoint for %s: %s", service, endpoint['VpcEndpointId'])
+                if service == 's3' and private_rt_id not in endpoint.get('RouteTableIds', []):
+                    self.ec2.modify_vpc_endpoint(
+                        VpcEndpointId=endpoint['VpcEndpointId'],
+                        AddRouteTableIds=[private_rt_id]
+                    )
+                return endpoint['VpcEndpointId']
             
-            # Associate private subnets with private route table
-            for subnet_id in self.private_subnets:
-                self.ec2.associate_route_table(
-                    RouteTableId=private_rt_id,
-                    SubnetId=subnet_id
+            params = {
+                'VpcId': self.vpc_id,
+                'ServiceName': service_name,
+                'TagSpecifications': [_tagspec('vpc-endpoint', f'MERN-{service}-Endpoint')]
+            }
+            if service == 's3':
+                params.update(VpcEndpointType='Gateway', RouteTableIds=[private_rt_id])
+            else:
+                params.update(
+                    VpcEndpointType='Interface',
+                    SubnetIds=self.private_subnets,
+                    SecurityGroupIds=[endpoint_sg_id],
+                    PrivateDnsEnabled=True
                 )
-            
-            print(f"✅ Private route table created and configured: {private_rt_id}")
-            print(f"✅ NAT Gateway created: {self.nat_gateway_id}")
-            
-            return public_rt_id, private_rt_id
-            
-        except ClientError as e:
-            print(f"❌ Error creating route tables: {e}")
-            return None, None
+            return self.ec2.create_vpc_endpoint(**params)['VpcEndpoint']['VpcEndpointId']
+        
+        services = ['s3'] + INTERFACE_ENDPOINT_SERVICES
+        with ThreadPoolExecutor(max_workers=len(services)) as executor:
+            self.vpc_endpoints = list(executor.map(create_endpoint, services))
+        
+        logger.info("VPC endpoints created: %s", self.vpc_endpoints)
+        return self.vpc_endpoints
+    
+    def _associate_subnets(self, route_table_id, subnet_ids):
+        """Associate subnets with a route table, concurrently"""
+        with ThreadPoolExecutor(max_workers=max(1, len(subnet_ids))) as executor:
+            list(executor.map(
+                lambda subnet_id: self.ec2.associate_route_table(RouteTableId=route_table_id, SubnetId=subnet_id),
+                subnet_ids
+            ))
     
     def create_security_groups(self):
         """Create security groups for different components with proper access rules"""
-        security_groups = {}
+        if self.security_groups:
+            logger.info("Reusing security groups: %s", list(self.security_groups.values()))
+            return self.security_groups
         
-        sg_configs = [
-            {
-                'name': 'MERN-ALB-SG',
-                'description': 'Security group for Application Load Balancer'
-            },
-            {
-                'name': 'MERN-Frontend-SG',
-                'description': 'Security group for Frontend instances'
-            },
-            {
-                'name': 'MERN-Backend-SG',
-                'description': 'Security group for Backend instances with internet and ALB access'
-            }
-        ]
+        security_groups = {}
+        sg_configs = SECURITY_GROUP_CONFIGS
         
         try:
-            for config in sg_configs:
-                response = self.ec2.create_security_group(
-                    GroupName=config['name'],
-                    Description=config['description'],
-                    VpcId=self.vpc_id
-                )
-                
-                sg_id = response['GroupId']
+            # Security groups are independent, create them concurrently
+            with ThreadPoolExecutor(max_workers=len(sg_configs)) as executor:
+                sg_ids = list(executor.map(self._create_security_group, sg_configs))
+            
+            for config, sg_id in zip(sg_configs, sg_ids):
                 security_groups[config['name']] = sg_id
-                
-                # Tag security group
-                self.ec2.create_tags(
-                    Resources=[sg_id],
-                    Tags=[
-                        {'Key': 'Name', 'Value': config['name']},
-                        {'Key': 'Project', 'Value': 'MERN-Microservices'}
-                    ]
-                )
-                
-                print(f"✅ Security group created: {config['name']} ({sg_id})")
             
             # Add rules after all security groups are created
             self._add_security_group_rules(security_groups)
             
+            self.security_groups = security_groups
             return security_groups
             
         except ClientError as e:
-            print(f"❌ Error creating security groups: {e}")
+            logger.error("Error creating security groups: %s", e)
             return None
     
+    def _create_security_group(self, config):
+        """Create and tag a single security group"""
+        sg_id = self._find_existing('security-group', config['name'])
+        if sg_id:
+            return sg_id
+        
+        response = self.ec2.create_security_group(
+            GroupName=config['name'],
+            Description=config['description'],
+            VpcId=self.vpc_id,
+            TagSpecifications=[_tagspec('security-group', config['name'])]
+        )
+        
+        sg_id = response['GroupId']
+        logger.info("Security group created: %s (%s)", config['name'], sg_id)
+        return sg_id
+    
+    def _ingress_rules(self, security_groups):
+        """Return the ingress permissions of each security group"""
+        ingress_rules = {}
+        
+        # ALB Security Group Rules - Allow HTTP/HTTPS from internet
+        ingress_rules['MERN-ALB-SG'] = [
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 80,
+                'ToPort': 80,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP from anywhere'}]
+            },
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 443,
+                'ToPort': 443,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS from anywhere'}]
+            }
+        ]
+        
+        # Frontend Security Group Rules (sources for the same port share one permission)
+        ingress_rules['MERN-Frontend-SG'] = [
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 3000,
+                'ToPort': 3000,
+                'UserIdGroupPairs': [{'GroupId': security_groups['MERN-ALB-SG'], 'Description': 'React app from ALB'}],
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'React app from internet (dev/testing)'}]
+            },
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 22,
+                'ToPort': 22,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
+            }
+        ]
+        
+        # FIXED Backend Security Group Rules - Allow multiple sources
+        ingress_rules['MERN-Backend-SG'] = [
+            # Allow ALB, frontend and internet (testing/direct) to access backend services
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 3001,
+                'ToPort': 3002,
+                'UserIdGroupPairs': [
+                    {'GroupId': security_groups['MERN-ALB-SG'], 'Description': 'API access from ALB'},
+                    {'GroupId': security_groups['MERN-Frontend-SG'], 'Description': 'API access from frontend'}
+                ],
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'API access from internet (testing/direct)'}]
+            },
+            # SSH access
+            {
+                'IpProtocol': 'tcp',
+                'FromPort': 22,
+                'ToPort': 22,
+                'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
+            }
+        ]
+        
+        return ingress_rules
+    
     def _add_security_group_rules(self, security_groups):
         """Add FIXED rules to security groups for proper MERN stack access"""
         try:
-            # ALB Security Group Rules - Allow HTTP/HTTPS from internet
-            print("Adding ALB security group rules...")
-            self.ec2.authorize_security_group_ingress(
-                GroupId=security_groups['MERN-ALB-SG'],
-                IpPermissions=[
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 80,
-                        'ToPort': 80,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP from anywhere'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 443,
-                        'ToPort': 443,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS from anywhere'}]
-                    }
-                ]
-            )
-            
-            # Frontend Security Group Rules
-            print("Adding Frontend security group rules...")
-            self.ec2.authorize_security_group_ingress(
-                GroupId=security_groups['MERN-Frontend-SG'],
-                IpPermissions=[
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3000,
-                        'ToPort': 3000,
-                        'UserIdGroupPairs': [{'GroupId': security_groups['MERN-ALB-SG'], 'Description': 'React app from ALB'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3000,
-                        'ToPort': 3000,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'React app from internet (dev/testing)'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 22,
-                        'ToPort': 22,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
-                    }
+            ingress_rules = self._ingress_rules(security_groups)
+            
+            # Ingress rules target different groups and the Backend outbound rules
+            # only touch egress, so every call is independent and runs concurrently
+            logger.info("Adding ALB, Frontend and FIXED Backend security group rules...")
+            logger.info("Adding Backend outbound rules...")
+            with ThreadPoolExecutor(max_workers=len(ingress_rules) + 1) as executor:
+                futures = [
+                    executor.submit(self.ec2.authorize_security_group_ingress, GroupId=security_groups[name], IpPermissions=permissions)
+                    for name, permissions in ingress_rules.items()
                 ]
-            )
-            
-            # FIXED Backend Security Group Rules - Allow multiple sources
-            print("Adding FIXED Backend security group rules...")
-            self.ec2.authorize_security_group_ingress(
-                GroupId=security_groups['MERN-Backend-SG'],
-                IpPermissions=[
-                    # Allow ALB to access backend services
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3001,
-                        'ToPort': 3002,
-                        'UserIdGroupPairs': [{'GroupId': security_groups['MERN-ALB-SG'], 'Description': 'API access from ALB'}]
-                    },
-                    # Allow frontend to access backend services
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3001,
-                        'ToPort': 3002,
-                        'UserIdGroupPairs': [{'GroupId': security_groups['MERN-Frontend-SG'], 'Description': 'API access from frontend'}]
-                    },
-                    # Allow internet access to backend services (for testing and direct access)
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 3001,
-                        'ToPort': 3002,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'API access from internet (testing/direct)'}]
-                    },
-                    # SSH access
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 22,
-                        'ToPort': 22,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'SSH access'}]
-                    }
-                ]
-            )
+                futures.append(executor.submit(self._restrict_backend_egress, security_groups['MERN-Backend-SG']))
+                for future in futures:
+                    future.result()
             
-            # Backend outbound rules for Cloud MongoDB and external APIs
-            print("Adding Backend outbound rules...")
-            
-            # First, remove default outbound rule (all traffic)
-            try:
-                default_rules = self.ec2.describe_security_groups(GroupIds=[security_groups['MERN-Backend-SG']])
-                for rule in default_rules['SecurityGroups'][0]['IpPermissionsEgress']:
-                    if rule.get('IpRanges') and rule['IpRanges'][0]['CidrIp'] == '0.0.0.0/0':
-                        self.ec2.revoke_security_group_egress(
-                            GroupId=security_groups['MERN-Backend-SG'],
-                            IpPermissions=[rule]
-                        )
-            except ClientError:
-                pass  # Continue if default rule doesn't exist
-            
-            # Add specific outbound rules
-            self.ec2.authorize_security_group_egress(
-                GroupId=security_groups['MERN-Backend-SG'],
-                IpPermissions=[
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 443,
-                        'ToPort': 443,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTPS for Cloud MongoDB and APIs'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 80,
-                        'ToPort': 80,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'HTTP for package downloads'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 27017,
-                        'ToPort': 27017,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'MongoDB Atlas/Cloud access'}]
-                    },
-                    {
-                        'IpProtocol': 'tcp',
-                        'FromPort': 53,
-                        'ToPort': 53,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'DNS TCP'}]
-                    },
-                    {
-                        'IpProtocol': 'udp',
-                        'FromPort': 53,
-                        'ToPort': 53,
-                        'IpRanges': [{'CidrIp': '0.0.0.0/0', 'Description': 'DNS UDP'}]
-                    }
-                ]
-            )
-            
-            print("✅ FIXED security group rules added successfully!")
-            print("   🔹 ALB can access backend services")
-            print("   🔹 Frontend can access backend services") 
-            print("   🔹 Internet can access backend services (for testing)")
-            print("   🔹 Backend can access MongoDB Atlas and external APIs")
+            logger.info("FIXED security group rules added successfully!")
+            logger.debug("   ALB can access backend services")
+            logger.debug("   Frontend can access backend services")
+            logger.debug("   Internet can access backend services (for testing)")
+            logger.debug("   Backend can access MongoDB Atlas and external APIs")
             
         except ClientError as e:
             if 'already exists' in str(e).lower():
-                print("⚠️  Some security group rules already exist - continuing...")
+                logger.warning("Some security group rules already exist - continuing...")
             else:
-                print(f"❌ Error adding security group rules: {e}")
+                logger.error("Error adding security group rules: %s", e)
                 raise
     
+    def _restrict_backend_egress(self, group_id):
+        """Replace the default allow-all egress rule with the backend outbound rules"""
+        # The default outbound rule's shape is fixed, so revoke it directly instead of describing the group
+        try:
+            self.ec2.revoke_security_group_egress(GroupId=group_id, IpPermissions=[DEFAULT_EGRESS_RULE])
+        except ClientError as e:
+            if e.response['Error']['Code'] != 'InvalidPermission.NotFound':
+                raise
+            # Continue if default rule doesn't exist
+        
+        # Add specific outbound rules
+        self.ec2.authorize_security_group_egress(GroupId=group_id, IpPermissions=BACKEND_EGRESS_RULES)
+    
     def get_infrastructure_info(self):
         """Return infrastructure information"""
         return {
@@ -430,95 +735,111 @@ class VPCInfrastructure:
             'private_subnets': self.private_subnets,
             'internet_gateway_id': self.internet_gateway_id,
             'nat_gateway_id': self.nat_gateway_id,
+            'vpc_endpoints': self.vpc_endpoints,
             'region': self.region
         }
     
-    def deploy_infrastructure(self):
-        """Deploy complete VPC infrastructure"""
-        print("🚀 Starting FIXED VPC infrastructure deployment...")
-        
-        # Create VPC
-        if not self.create_vpc():
-            return False
-        
-        # Create Internet Gateway
-        if not self.create_internet_gateway():
-            return False
-        
-        # Create Subnets
-        public_subnets, private_subnets = self.create_subnets()
-        if not public_subnets:
-            return False
-        
-        # Create Route Tables
-        public_rt, private_rt = self.create_route_tables()
-        if not public_rt:
-            return False
-        
-        # Create Security Groups
-        security_groups = self.create_security_groups()
-        if not security_groups:
-            return False
-        
-        print("\n🎉 FIXED VPC Infrastructure deployment completed successfully!")
-        print(f"📋 Infrastructure Info:")
+    def _save_deployment_info(self, security_groups, public_rt, private_rt):
+        """Print the deployment summary and save it to the States folder"""
+        logger.info("FIXED VPC Infrastructure deployment completed successfully!")
+        logger.info("Infrastructure Info:")
         info = self.get_infrastructure_info()
         for key, value in info.items():
-            print(f"   {key}: {value}")
+            logger.info("   %s: %s", key, value)
         
-        print(f"\n🔐 Security Groups:")
+        logger.info("Security Groups:")
         for sg_name, sg_id in security_groups.items():
-            print(f"   {sg_name}: {sg_id}")
+            logger.info("   %s: %s", sg_name, sg_id)
         
         # Save infrastructure info to States folder
-        import os
-        states_dir = 'States'
-        if not os.path.exists(states_dir):
-            os.makedirs(states_dir)
-            
-        output_data = {
-            **info, 
-            'security_groups': security_groups,
-            'route_tables': {
-                'public': public_rt,
-                'private': private_rt
-            }
-        }
+        self.security_groups = security_groups
+        self.route_tables = {'public': public_rt, 'private': private_rt}
+        self._checkpoint(complete=True)
+        
+        logger.info("FIXED Infrastructure info saved to '%s'", self._state_path)
         
-        output_file = os.path.join(states_dir, 'VPC-Deploy-Info.json')
-        with open(output_file, 'w') as f:
-            json.dump(output_data, f, indent=2)
+        logger.debug("Key Improvements in FIXED version:")
+        logger.debug("   Backend SG allows ALB access (ports 3001-3002)")
+        logger.debug("   Backend SG allows internet access (for testing)")
+        logger.debug("   Backend SG allows frontend access")
+        logger.debug("   Proper outbound rules for MongoDB Atlas")
+        logger.debug("   DNS resolution support")
+    
+    def deploy_infrastructure(self):
+        """Deploy complete VPC infrastructure"""
+        logger.info("Starting FIXED VPC infrastructure deployment...")
+        
+        # Create VPC
+        if not self.create_vpc():
+            return False
+        self._checkpoint()
+        
+        if self.use_nat_gateway and not self.nat_gateway_id:
+            try:
+                self.nat_gateway_id = self._find_existing('natgateway', 'MERN-NAT')
+            except ClientError as e:
+                logger.error("Error looking up NAT Gateway: %s", e)
+                return False
         
-        print(f"💾 FIXED Infrastructure info saved to '{output_file}'")
+        # The NAT Elastic IP needs nothing from the VPC, so it is allocated while
+        # the Internet Gateway and Subnets (which only need the VPC) are created
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            allocation_future = None
+            if self.use_nat_gateway and not self.nat_gateway_id:
+                allocation_future = executor.submit(self.allocate_nat_address)
+            igw_future = executor.submit(self.create_internet_gateway)
+            subnets_future = executor.submit(self.create_subnets)
+            internet_gateway_id = igw_future.result()
+            public_subnets, private_subnets = subnets_future.result()
+            
+            if not internet_gateway_id or not public_subnets:
+                if allocation_future is not None:
+                    self.release_nat_address(allocation_future)
+                return False
+            self._checkpoint()
+            
+            # Create the NAT Gateway in the background while security groups and
+            # route tables are created; only the private NAT route waits for it.
+            # The task returns once the gateway exists, so failed steps below never
+            # block on the availability waiter
+            if allocation_future is not None:
+                self._nat_future = executor.submit(self.start_nat_gateway, allocation_future)
+            
+            # Create Security Groups
+            security_groups = self.create_security_groups()
+            if not security_groups:
+                return False
+            self._checkpoint()
+            
+            # Create Route Tables
+            public_rt, private_rt = self.create_route_tables()
+            if not public_rt:
+                return False
         
-        print(f"\n✨ Key Improvements in FIXED version:")
-        print(f"   🔹 Backend SG allows ALB access (ports 3001-3002)")
-        print(f"   🔹 Backend SG allows internet access (for testing)")
-        print(f"   🔹 Backend SG allows frontend access")
-        print(f"   🔹 Proper outbound rules for MongoDB Atlas")
-        print(f"   🔹 DNS resolution support")
+        self._save_deployment_info(security_groups, public_rt, private_rt)
         
         return True
 
 
 def main():
     """Main function to deploy FIXED VPC infrastructure"""
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(message)s')
     infrastructure = VPCInfrastructure()
     
     try:
         success = infrastructure.deploy_infrastructure()
         if success:
-            print("\n✅ All FIXED infrastructure components deployed successfully!")
-            print("\n🧪 Ready for:")
-            print("   - Direct backend testing (ports 3001-3002)")
-            print("   - ALB-based load balancing")
-            print("   - Frontend-to-backend communication")
-            print("   - MongoDB Atlas connectivity")
+            logger.info("All FIXED infrastructure components deployed successfully!")
+            logger.info("Ready for:")
+            logger.info("   - Direct backend testing (ports 3001-3002)")
+            logger.info("   - ALB-based load balancing")
+            logger.info("   - Frontend-to-backend communication")
+            logger.info("   - MongoDB Atlas connectivity")
         else:
-            print("\n❌ Infrastructure deployment failed!")
+            logger.error("Infrastructure deployment failed!")
             
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
 
 
 if __name__ == "__main__":
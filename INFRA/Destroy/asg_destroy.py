@@ -5,60 +5,263 @@ Only destroys resources created by asg_deployment.py using the deployment JSON f
 """
 
 import boto3
+import functools
 import json
+import logging
 import time
-import os
-from botocore.exceptions import ClientError
+import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+from botocore.waiter import WaiterModel, create_waiter_with_client
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Tag that asg_deployment.py puts on every backend resource
+PROJECT_TAG_FILTER = {'Key': 'Project', 'Values': ['MERN-Microservices']}
+
+logger = logging.getLogger(__name__)
+
+# One config for every client: pooled keep-alive connections, adaptive retries and
+# short timeouts so a stalled connection is retried instead of hanging a step
+CLIENT_CONFIG = Config(
+    max_pool_connections=32,
+    retries={'mode': 'adaptive', 'max_attempts': 10},
+    connect_timeout=5,
+    read_timeout=20,
+    tcp_keepalive=True,
+    user_agent_extra='asg-destroyer/1.0'
+)
+
+# Clients are shared by every destroyer of the same region
+_session = boto3.session.Session()
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+def _client(service, region):
+    """Return the shared client for a service and region, creating it once"""
+    with _clients_lock:
+        if (service, region) not in _clients:
+            _clients[(service, region)] = _session.client(service, region_name=region, config=CLIENT_CONFIG)
+        return _clients[(service, region)]
+
+
+def _not_found(e, *codes):
+    """Tell whether a ClientError carries one of the given not-found error codes"""
+    return e.response.get('Error', {}).get('Code') in codes
+
+
+# Role and instance profile created by asg_deployment.py for the backend instances
+IAM_ROLE_NAME = 'Ubuntu-ECR-CloudWatch-Role'
+
+@functools.lru_cache(maxsize=16)
+def _load_backend(path, mtime):
+    """Parse a deployment file; the mtime key invalidates the cache when the file changes"""
+    data = Path(path).read_bytes()
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch either
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+# One shape for every resource to destroy, built once from the deployment info
+Resource = namedtuple('Resource', ['arn', 'name', 'id'], defaults=[None, None, None])
+
+# Auto Scaling ships no waiter for group deletion; succeeds once the group is gone (2 minutes max)
+ASG_DELETED_WAITER = {
+    'version': 2,
+    'waiters': {
+        'AsgDeleted': {
+            'operation': 'DescribeAutoScalingGroups',
+            'delay': 10,
+            'maxAttempts': 12,
+            'acceptors': [
+                {
+                    'matcher': 'path',
+                    'argument': 'length(AutoScalingGroups) == `0`',
+                    'expected': True,
+                    'state': 'success'
+                }
+            ]
+        }
+    }
+}
+
+# Shape of an AWS ARN, checked locally before any delete call is spent on it
+_ARN_RE = re.compile(r'^arn:aws[^:]*:[^:]+:[^:]*:\d{12}:.+')
+
+# Deployment file keys that make resource discovery unnecessary
+REQUIRED_BACKEND_KEYS = ('asg_name', 'alb_arn', 'target_groups', 'template_id')
+
+# Name tags asg_deployment.py gives the backend resources
+BACKEND_NAME_TAGS = [
+    'MERN-Ubuntu-Backend-ASG',
+    'MERN-Ubuntu-Backend-Template',
+    'MERN-Ubuntu-Backend-ALB',
+    'MERN-Ubuntu-Hello-TG',
+    'MERN-Ubuntu-Profile-TG',
+    'MERN-Ubuntu-Frontend-TG'
+]
+
+# Tagging API resource types of the backend resources
+BACKEND_RESOURCE_TYPES = [
+    'autoscaling:autoScalingGroup',
+    'ec2:launch-template',
+    'elasticloadbalancing:loadbalancer/app',
+    'elasticloadbalancing:targetgroup'
+]
 
 
 class PreciseASGDestroyer:
-    def __init__(self, region='ap-south-1', backend_file='States/Backend-Deploy-Info.json'):
+    def __init__(self, region='ap-south-1', backend_file='States/Ubuntu-Backend-Deploy-Info.json', delete_iam_role=False):
         self.region = region
-        self.ec2 = boto3.client('ec2', region_name=region)
-        self.autoscaling = boto3.client('autoscaling', region_name=region)
-        self.elbv2 = boto3.client('elbv2', region_name=region)
-        self.iam = boto3.client('iam', region_name=region)
+        self.delete_iam_role = delete_iam_role
+        self.ec2 = _client('ec2', region)
+        self.autoscaling = _client('autoscaling', region)
+        self.elbv2 = _client('elbv2', region)
+        self.iam = _client('iam', region)
+        self.tagging = _client('resourcegroupstaggingapi', region)
+        self._asg_deleted_waiter = create_waiter_with_client(
+            'AsgDeleted', WaiterModel(ASG_DELETED_WAITER), self.autoscaling
+        )
         self.backend_file = backend_file
+        self._backend_path = Path(backend_file)
         self.backend_info = None
+        self.resources = {}
+        self._role_state = {}
         
+        # Resolve credentials and open IAM/Auto Scaling connections off the critical path
+        threading.Thread(target=self._warm_clients, daemon=True).start()
+        
+    def _warm_clients(self):
+        """Issue cheap IAM and Auto Scaling calls so their first real call is not slowed"""
+        for warm_up in (self.iam.list_account_aliases, self.autoscaling.describe_account_limits):
+            try:
+                warm_up()
+            except (BotoCoreError, ClientError):
+                pass  # Best effort, real calls report their own errors
+    
     def load_backend_info(self):
         """Load backend deployment information from JSON file"""
         try:
-            with open(self.backend_file, 'r') as f:
-                self.backend_info = json.load(f)
-                print(f"✅ Loaded backend deployment info from {self.backend_file}")
-                print(f"📋 Resources to destroy:")
-                print(f"   - Launch Template: {self.backend_info.get('template_id', 'Not found')}")
-                print(f"   - ALB ARN: {self.backend_info.get('alb_arn', 'Not found')}")
-                print(f"   - ALB DNS: {self.backend_info.get('alb_dns', 'Not found')}")
-                print(f"   - ASG Name: {self.backend_info.get('asg_name', 'Not found')}")
-                print(f"   - Target Groups: {len(self.backend_info.get('target_groups', {}))}")
-                return True
+            # Copy, the cached dict is shared and missing keys get filled in below
+            self.backend_info = dict(_load_backend(self.backend_file, self._backend_path.stat().st_mtime))
+            logger.info("Loaded backend deployment info from %s", self.backend_file)
         except FileNotFoundError:
-            print(f"❌ Backend deployment file not found: {self.backend_file}")
-            print("   Cannot proceed without deployment information!")
+            # Without the file there is no telling which resources are this deployment's
+            logger.error("Backend deployment file not found: %s", self.backend_file)
+            logger.info("   Cannot proceed without deployment information!")
             return False
         except json.JSONDecodeError:
-            print(f"❌ Invalid JSON in file: {self.backend_file}")
+            logger.error("Invalid JSON in file: %s", self.backend_file)
             return False
+        
+        # Fast path: a complete deployment file needs no discovery calls at all;
+        # otherwise only the keys missing from the file are looked up
+        missing_keys = [key for key in REQUIRED_BACKEND_KEYS if not self.backend_info.get(key)]
+        if missing_keys:
+            logger.info("   Discovering %s by Project tag", ', '.join(missing_keys))
+            discovered = self.discover_backend_resources()
+            for key in missing_keys:
+                if discovered.get(key):
+                    self.backend_info[key] = discovered[key]
+            if not any(self.backend_info.get(key) for key in REQUIRED_BACKEND_KEYS):
+                logger.warning("No backend resources found")
+        else:
+            logger.info("   Deployment file is complete, skipping discovery")
+        
+        logger.info("Resources to destroy:")
+        logger.info("   - Launch Template: %s", self.backend_info.get('template_id', 'Not found'))
+        logger.info("   - ALB ARN: %s", self.backend_info.get('alb_arn', 'Not found'))
+        logger.info("   - ALB DNS: %s", self.backend_info.get('alb_dns', 'Not found'))
+        logger.info("   - ASG Name: %s", self.backend_info.get('asg_name', 'Not found'))
+        logger.info("   - Target Groups: %s", len(self.backend_info.get('target_groups', {})))
+        
+        self.resources = self._build_resources(self.backend_info)
+        self._drop_malformed_arns()
+        return True
+    
+    def _drop_malformed_arns(self):
+        """Skip resources whose ARN cannot be valid instead of failing their delete calls"""
+        load_balancer = self.resources['load_balancer']
+        if load_balancer and not _ARN_RE.match(load_balancer.arn):
+            logger.warning("Skipping malformed ALB ARN: %s", load_balancer.arn)
+            self.resources['load_balancer'] = None
+        
+        target_groups = self.resources['target_groups']
+        valid = [tg for tg in target_groups if _ARN_RE.match(tg.arn)]
+        if len(valid) != len(target_groups):
+            logger.warning("Skipping %s malformed target group ARNs", len(target_groups) - len(valid))
+            self.resources['target_groups'] = valid
     
-    def wait_with_progress(self, seconds, message):
-        """Wait with progress indicator"""
-        print(f"⏳ {message}")
-        for i in range(seconds):
-            print(".", end="", flush=True)
-            time.sleep(1)
-        print(" Done!")
+    @staticmethod
+    def _build_resources(backend_info):
+        """Normalize deployment info into Resource tuples, None where a resource is absent"""
+        return {
+            'asg': Resource(name=backend_info['asg_name']) if backend_info.get('asg_name') else None,
+            'load_balancer': (
+                Resource(arn=backend_info['alb_arn'], name=backend_info.get('alb_dns', 'Unknown'))
+                if backend_info.get('alb_arn') else None
+            ),
+            'target_groups': [
+                Resource(arn=tg_arn, name=tg_name)
+                for tg_name, tg_arn in (backend_info.get('target_groups') or {}).items()
+            ],
+            'launch_template': Resource(id=backend_info['template_id']) if backend_info.get('template_id') else None
+        }
+    
+    def discover_backend_resources(self):
+        """Find tagged backend resources server-side with the Resource Groups Tagging API"""
+        info = {'target_groups': {}}
+        try:
+            resources = self.tagging.get_paginator('get_resources').paginate(
+                TagFilters=[PROJECT_TAG_FILTER, {'Key': 'Name', 'Values': BACKEND_NAME_TAGS}],
+                ResourceTypeFilters=BACKEND_RESOURCE_TYPES
+            ).build_full_result()['ResourceTagMappingList']
+        except ClientError as e:
+            logger.error("Error discovering backend resources: %s", e)
+            return info
+        
+        matches = {'asg_name': [], 'template_id': [], 'alb_arn': []}
+        for resource in resources:
+            arn = resource['ResourceARN']
+            resource_path = arn.split(':', 5)[5]
+            
+            if ':autoScalingGroupName/' in arn:
+                matches['asg_name'].append(arn.split(':autoScalingGroupName/', 1)[1])
+            elif resource_path.startswith('launch-template/'):
+                matches['template_id'].append(resource_path.split('/', 1)[1])
+            elif resource_path.startswith('loadbalancer/app/'):
+                matches['alb_arn'].append(arn)
+            elif resource_path.startswith('targetgroup/'):
+                info['target_groups'][resource_path.split('/')[1]] = arn
+        
+        # Never pick one of several candidates; that resource is left for a manual look
+        for key, values in matches.items():
+            if len(values) == 1:
+                info[key] = values[0]
+            elif len(values) > 1:
+                logger.warning("   %s tagged resources match %s, skipping it: %s", len(values), key, ', '.join(values))
+        
+        logger.info("Discovered %s tagged backend resources", len(resources))
+        return info
     
     def delete_auto_scaling_group(self):
         """Delete the specific Auto Scaling Group"""
-        asg_name = self.backend_info.get('asg_name')
-        if not asg_name:
-            print("⚠️  No ASG name found in deployment info")
+        asg = self.resources['asg']
+        if not asg:
+            logger.warning("No ASG name found in deployment info")
             return True
+        asg_name = asg.name
         
         try:
-            print(f"\n🔄 Processing Auto Scaling Group: {asg_name}")
+            logger.info("Processing Auto Scaling Group: %s", asg_name)
             
             # Check if ASG exists
             try:
@@ -66,206 +269,246 @@ class PreciseASGDestroyer:
                     AutoScalingGroupNames=[asg_name]
                 )
                 if not asg_response['AutoScalingGroups']:
-                    print(f"ℹ️  ASG {asg_name} does not exist")
+                    logger.info("ASG %s does not exist", asg_name)
                     return True
             except ClientError as e:
-                if 'does not exist' in str(e):
-                    print(f"ℹ️  ASG {asg_name} does not exist")
+                if _not_found(e, 'ValidationError'):
+                    logger.info("ASG %s does not exist", asg_name)
                     return True
                 raise
             
-            # Delete scaling policies first
-            try:
-                policies_response = self.autoscaling.describe_policies(
-                    AutoScalingGroupName=asg_name
-                )
-                for policy in policies_response['ScalingPolicies']:
-                    print(f"   Deleting scaling policy: {policy['PolicyName']}")
-                    self.autoscaling.delete_policy(
-                        AutoScalingGroupName=asg_name,
-                        PolicyName=policy['PolicyName']
-                    )
-            except ClientError as e:
-                print(f"   ⚠️  Could not delete scaling policies: {e}")
-            
             # Cancel any ongoing instance refresh
             try:
                 self.autoscaling.cancel_instance_refresh(AutoScalingGroupName=asg_name)
-                print("   Cancelled any ongoing instance refresh")
+                logger.info("   Cancelled any ongoing instance refresh")
             except ClientError:
                 pass  # No refresh to cancel
             
-            # Set capacity to 0 to terminate instances
-            print(f"   Setting ASG capacity to 0...")
-            self.autoscaling.update_auto_scaling_group(
-                AutoScalingGroupName=asg_name,
-                MinSize=0,
-                MaxSize=0,
-                DesiredCapacity=0
-            )
-            
-            # Wait for instances to terminate
-            print(f"   Waiting for instances to terminate...")
-            max_attempts = 24  # 12 minutes max
-            attempt = 0
-            
-            while attempt < max_attempts:
-                try:
-                    asg_info = self.autoscaling.describe_auto_scaling_groups(
-                        AutoScalingGroupNames=[asg_name]
-                    )
-                    
-                    if not asg_info['AutoScalingGroups']:
-                        break
-                        
-                    current_asg = asg_info['AutoScalingGroups'][0]
-                    instance_count = len(current_asg['Instances'])
-                    
-                    if instance_count == 0:
-                        print("   ✅ All instances terminated")
-                        break
-                    else:
-                        print(f"   ⏳ {instance_count} instances still terminating...")
-                        time.sleep(30)  # Wait 30 seconds between checks
-                        
-                except ClientError:
-                    break
-                
-                attempt += 1
-            
-            if attempt >= max_attempts:
-                print(f"   ⚠️  Timeout waiting for instances to terminate, proceeding with force delete")
+            # Kick off every instance termination at once rather than leaving it to the
+            # ASG controller; Min/Max 0 lets desired capacity drop and stops replacements
+            instance_ids = [
+                instance['InstanceId']
+                for instance in asg_response['AutoScalingGroups'][0]['Instances']
+            ]
+            if instance_ids:
+                logger.info("   Terminating %s instances...", len(instance_ids))
+                self.autoscaling.update_auto_scaling_group(
+                    AutoScalingGroupName=asg_name,
+                    MinSize=0,
+                    MaxSize=0
+                )
+                with ThreadPoolExecutor(max_workers=min(20, len(instance_ids))) as executor:
+                    list(executor.map(self._terminate_asg_instance, instance_ids))
             
-            # Delete the ASG
-            print(f"   Deleting ASG: {asg_name}")
+            # ForceDelete terminates any instance left over and drops the scaling policies
+            logger.info("   Deleting ASG: %s", asg_name)
             self.autoscaling.delete_auto_scaling_group(
                 AutoScalingGroupName=asg_name,
                 ForceDelete=True
             )
             
-            print(f"   ✅ ASG {asg_name} deleted successfully")
+            # The ASG disappears once its instances are gone, which the IAM role step relies on
+            logger.info("   Waiting for ASG and its instances to be deleted...")
+            try:
+                self._asg_deleted_waiter.wait(AutoScalingGroupNames=[asg_name])
+                logger.info("   ASG %s deleted successfully", asg_name)
+            except WaiterError:
+                if self._wait_for_asg_instances(instance_ids):
+                    logger.info("   ASG %s instances terminated", asg_name)
+                else:
+                    logger.warning("   ASG %s is still deleting, continuing", asg_name)
             return True
             
         except ClientError as e:
-            print(f"   ❌ Error deleting ASG {asg_name}: {e}")
+            logger.error("   Error deleting ASG %s: %s", asg_name, e)
+            return False
+    
+    def _wait_for_asg_instances(self, instance_ids, timeout=300):
+        """Poll the minimal instances view until the ASG instances are gone"""
+        if not instance_ids:
             return False
+        
+        # Poll often at first, when the last instances usually finish, then back off (1s up to 30s)
+        deadline = time.monotonic() + timeout
+        attempt = 0
+        while True:
+            # Only the ASG's own instances are asked for, so the page stays small
+            response = self.autoscaling.describe_auto_scaling_instances(
+                InstanceIds=instance_ids,
+                MaxRecords=min(50, len(instance_ids))
+            )
+            if not response['AutoScalingInstances']:
+                return True
+            logger.info("   %s instances still terminating...", len(response['AutoScalingInstances']))
+            
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(2 ** attempt, 30, remaining))
+            attempt += 1
+    
+    def _terminate_asg_instance(self, instance_id):
+        """Terminate one ASG instance and decrement the group's desired capacity"""
+        try:
+            self.autoscaling.terminate_instance_in_auto_scaling_group(
+                InstanceId=instance_id,
+                ShouldDecrementDesiredCapacity=True
+            )
+        except ClientError as e:
+            # Already terminating or gone, ForceDelete covers it
+            logger.warning("   Could not terminate instance %s: %s", instance_id, e)
     
     def delete_load_balancer(self):
         """Delete the specific Application Load Balancer"""
-        alb_arn = self.backend_info.get('alb_arn')
-        alb_dns = self.backend_info.get('alb_dns', 'Unknown')
-        
-        if not alb_arn:
-            print("⚠️  No ALB ARN found in deployment info")
+        load_balancer = self.resources['load_balancer']
+        if not load_balancer:
+            logger.warning("No ALB ARN found in deployment info")
             return True
+        alb_arn, alb_dns = load_balancer.arn, load_balancer.name
         
         try:
-            print(f"\n🔄 Processing Load Balancer: {alb_dns}")
+            logger.info("Processing Load Balancer: %s", alb_dns)
             
-            # Check if ALB exists
+            # Delete listeners first; a missing ALB fails here and counts as already deleted (independent of each other, so concurrently)
             try:
-                alb_response = self.elbv2.describe_load_balancers(
-                    LoadBalancerArns=[alb_arn]
-                )
-                if not alb_response['LoadBalancers']:
-                    print(f"ℹ️  ALB does not exist")
-                    return True
-            except ClientError as e:
-                if 'does not exist' in str(e) or 'not found' in str(e):
-                    print(f"ℹ️  ALB does not exist")
-                    return True
-                raise
-            
-            # Delete listeners first
-            try:
-                listeners_response = self.elbv2.describe_listeners(
+                listeners = self.elbv2.get_paginator('describe_listeners').paginate(
                     LoadBalancerArn=alb_arn
-                )
-                for listener in listeners_response['Listeners']:
-                    print(f"   Deleting listener on port {listener['Port']}")
-                    self.elbv2.delete_listener(ListenerArn=listener['ListenerArn'])
+                ).build_full_result()['Listeners']
+                for listener in listeners:
+                    logger.info("   Deleting listener on port %s", listener['Port'])
+                with ThreadPoolExecutor(max_workers=max(1, min(10, len(listeners)))) as executor:
+                    list(executor.map(
+                        lambda listener: self.elbv2.delete_listener(ListenerArn=listener['ListenerArn']),
+                        listeners
+                    ))
             except ClientError as e:
-                print(f"   ⚠️  Could not delete listeners: {e}")
+                if _not_found(e, 'LoadBalancerNotFound'):
+                    raise
+                logger.warning("   Could not delete listeners: %s", e)
             
             # Delete the load balancer
-            print(f"   Deleting ALB...")
+            logger.info("   Deleting ALB...")
             self.elbv2.delete_load_balancer(LoadBalancerArn=alb_arn)
-            print(f"   ✅ ALB deletion initiated")
+            logger.info("   ALB deletion initiated")
+            
+            # Return as soon as AWS reports the ALB gone instead of sleeping a fixed minute
+            self.wait_for_load_balancer_deleted(alb_arn)
             
             return True
             
         except ClientError as e:
-            print(f"   ❌ Error deleting ALB: {e}")
+            if _not_found(e, 'LoadBalancerNotFound'):
+                logger.info("ALB does not exist")
+                return True
+            logger.error("   Error deleting ALB: %s", e)
             return False
     
+    def wait_for_load_balancer_deleted(self, alb_arn):
+        """Wait until the load balancer no longer exists"""
+        logger.info("Waiting for Load Balancer to be fully deleted")
+        try:
+            self.elbv2.get_waiter('load_balancers_deleted').wait(
+                LoadBalancerArns=[alb_arn],
+                WaiterConfig={'Delay': 5, 'MaxAttempts': 24}
+            )
+            logger.info("   Load Balancer deleted")
+            return True
+        except WaiterError as e:
+            logger.warning("   Load Balancer waiter failed (%s), polling instead", e)
+        
+        # Short bounded poll in case the waiter gave up early
+        for _ in range(6):
+            try:
+                self.elbv2.describe_load_balancers(LoadBalancerArns=[alb_arn])
+            except ClientError as e:
+                if _not_found(e, 'LoadBalancerNotFound'):
+                    logger.info("   Load Balancer deleted")
+                    return True
+                raise
+            time.sleep(5)
+        
+        logger.warning("   Load Balancer still deleting, continuing")
+        return False
+    
     def delete_target_groups(self):
         """Delete the specific Target Groups"""
-        target_groups = self.backend_info.get('target_groups', {})
+        target_groups = self.resources['target_groups']
         
         if not target_groups:
-            print("ℹ️  No target groups found in deployment info")
+            logger.info("No target groups found in deployment info")
             return True
         
-        print(f"\n🔄 Processing Target Groups ({len(target_groups)} groups)")
+        logger.info("Processing Target Groups (%s groups)", len(target_groups))
         
+        # Target groups are independent, delete them concurrently
         success = True
-        for tg_name, tg_arn in target_groups.items():
-            try:
-                print(f"   Processing target group: {tg_name}")
-                
-                # Check if target group exists
-                try:
-                    tg_response = self.elbv2.describe_target_groups(
-                        TargetGroupArns=[tg_arn]
-                    )
-                    if not tg_response['TargetGroups']:
-                        print(f"     ℹ️  Target group {tg_name} does not exist")
-                        continue
-                except ClientError as e:
-                    if 'does not exist' in str(e) or 'not found' in str(e):
-                        print(f"     ℹ️  Target group {tg_name} does not exist")
-                        continue
-                    raise
-                
-                # Deregister all targets first
-                try:
-                    targets_response = self.elbv2.describe_target_health(
-                        TargetGroupArn=tg_arn
-                    )
-                    if targets_response['TargetHealthDescriptions']:
-                        target_list = [
-                            {'Id': target['Target']['Id']} 
-                            for target in targets_response['TargetHealthDescriptions']
-                        ]
-                        self.elbv2.deregister_targets(
-                            TargetGroupArn=tg_arn,
-                            Targets=target_list
-                        )
-                        print(f"     Deregistered {len(target_list)} targets")
-                        time.sleep(10)  # Wait for deregistration
-                except ClientError as e:
-                    print(f"     ⚠️  Could not deregister targets: {e}")
-                
-                # Delete the target group
-                self.elbv2.delete_target_group(TargetGroupArn=tg_arn)
-                print(f"     ✅ Target group {tg_name} deleted")
-                
-            except ClientError as e:
-                print(f"     ❌ Error deleting target group {tg_name}: {e}")
-                success = False
+        with ThreadPoolExecutor(max_workers=min(8, len(target_groups))) as executor:
+            futures = {executor.submit(self._delete_target_group, tg): tg.name for tg in target_groups}
+            for future in as_completed(futures):
+                if not future.result():
+                    logger.warning("   Target group %s was not deleted", futures[future])
+                    success = False
         
         return success
     
+    def _delete_target_group(self, target_group):
+        """Delete a single Target Group, deregistering its targets only if it is still in use"""
+        tg_name, tg_arn = target_group.name, target_group.arn
+        try:
+            logger.info("   Processing target group: %s", tg_name)
+            
+            # The ALB listeners and ASG are gone by now, so the delete normally succeeds directly;
+            # only back off (1, 2, 4, 8s) while ELB has not caught up with the listener deletes
+            for attempt in range(5):
+                try:
+                    self.elbv2.delete_target_group(TargetGroupArn=tg_arn)
+                    break
+                except ClientError as e:
+                    if e.response['Error']['Code'] != 'ResourceInUse' or attempt == 4:
+                        raise
+                    if attempt == 0:
+                        self._deregister_targets(tg_arn)
+                    time.sleep(2 ** attempt)
+            
+            logger.info("     Target group %s deleted", tg_name)
+            return True
+            
+        except ClientError as e:
+            if _not_found(e, 'TargetGroupNotFound'):
+                logger.info("     Target group %s does not exist", tg_name)
+                return True
+            logger.error("     Error deleting target group %s: %s", tg_name, e)
+            return False
+    
+    def _deregister_targets(self, tg_arn):
+        """Deregister every target of a Target Group (slow path for a group still in use)"""
+        try:
+            targets_response = self.elbv2.describe_target_health(
+                TargetGroupArn=tg_arn
+            )
+            if targets_response['TargetHealthDescriptions']:
+                target_list = [
+                    {'Id': target['Target']['Id']} 
+                    for target in targets_response['TargetHealthDescriptions']
+                ]
+                self.elbv2.deregister_targets(
+                    TargetGroupArn=tg_arn,
+                    Targets=target_list
+                )
+                logger.info("     Deregistered %s targets", len(target_list))
+        except ClientError as e:
+            logger.warning("     Could not deregister targets: %s", e)
+    
     def delete_launch_template(self):
         """Delete the specific Launch Template"""
-        template_id = self.backend_info.get('template_id')
-        
-        if not template_id:
-            print("⚠️  No launch template ID found in deployment info")
+        launch_template = self.resources['launch_template']
+        if not launch_template:
+            logger.warning("No launch template ID found in deployment info")
             return True
+        template_id = launch_template.id
         
         try:
-            print(f"\n🔄 Processing Launch Template: {template_id}")
+            logger.info("Processing Launch Template: %s", template_id)
             
             # Check if launch template exists
             try:
@@ -273,185 +516,302 @@ class PreciseASGDestroyer:
                     LaunchTemplateIds=[template_id]
                 )
                 if not lt_response['LaunchTemplates']:
-                    print(f"ℹ️  Launch template {template_id} does not exist")
+                    logger.info("Launch template %s does not exist", template_id)
                     return True
                     
                 template_name = lt_response['LaunchTemplates'][0]['LaunchTemplateName']
-                print(f"   Found template: {template_name}")
+                logger.info("   Found template: %s", template_name)
                 
             except ClientError as e:
-                if 'does not exist' in str(e) or 'not found' in str(e):
-                    print(f"ℹ️  Launch template {template_id} does not exist")
+                if _not_found(e, 'InvalidLaunchTemplateId.NotFound', 'InvalidLaunchTemplateId.Malformed'):
+                    logger.info("Launch template %s does not exist", template_id)
                     return True
                 raise
             
             # Delete the launch template
             self.ec2.delete_launch_template(LaunchTemplateId=template_id)
-            print(f"   ✅ Launch template {template_id} deleted")
+            logger.info("   Launch template %s deleted", template_id)
             
             return True
             
         except ClientError as e:
-            print(f"   ❌ Error deleting launch template {template_id}: {e}")
+            logger.error("   Error deleting launch template %s: %s", template_id, e)
             return False
     
     def cleanup_iam_role(self):
         """Clean up the IAM role (only if not used by other resources)"""
-        role_name = 'EC2-ECR-CloudWatch-Role'
+        role_name = IAM_ROLE_NAME
         
         try:
-            print(f"\n🔄 Checking IAM role: {role_name}")
+            logger.info("Checking IAM role: %s", role_name)
             
             # Check if role exists
             try:
                 self.iam.get_role(RoleName=role_name)
             except ClientError as e:
                 if e.response['Error']['Code'] == 'NoSuchEntity':
-                    print(f"   ℹ️  IAM role {role_name} does not exist")
+                    logger.info("   IAM role %s does not exist", role_name)
                     return True
                 raise
             
             # Check if role is being used by other resources
             # For safety, we'll leave the role if there are other EC2 instances using it
             try:
-                # Check if there are any instances with this instance profile
-                instances_response = self.ec2.describe_instances(
+                # Check if there are any instances with this instance profile; one is enough
+                # to keep the role, so small pages are read lazily and the scan stops at the first hit
+                pages = self.ec2.get_paginator('describe_instances').paginate(
                     Filters=[
                         {'Name': 'iam-instance-profile.arn', 'Values': [f'*{role_name}*']},
                         {'Name': 'instance-state-name', 'Values': ['running', 'stopped', 'stopping']}
-                    ]
-                )
-                
-                instance_count = sum(
-                    len(reservation['Instances']) 
-                    for reservation in instances_response['Reservations']
+                    ],
+                    PaginationConfig={'PageSize': 5}
                 )
                 
-                if instance_count > 0:
-                    print(f"   ⚠️  IAM role {role_name} is still used by {instance_count} instances")
-                    print(f"   Leaving role intact for safety")
+                if any(reservation['Instances'] for page in pages for reservation in page['Reservations']):
+                    logger.warning("   IAM role %s is still used by instances", role_name)
+                    logger.info("   Leaving role intact for safety")
                     return True
                 
             except ClientError as e:
-                print(f"   ⚠️  Could not check role usage: {e}")
-                print(f"   Leaving role intact for safety")
+                logger.warning("   Could not check role usage: %s", e)
+                logger.info("   Leaving role intact for safety")
                 return True
             
-            print(f"   ℹ️  IAM role {role_name} is not used by any instances")
-            print(f"   Leaving role intact (can be manually deleted if not needed)")
+            logger.info("   IAM role %s is not used by any instances", role_name)
+            if self.delete_iam_role:
+                return self._delete_role(role_name)
+            
+            logger.info("   Leaving role intact (can be manually deleted if not needed)")
             return True
             
         except ClientError as e:
-            print(f"   ❌ Error checking IAM role: {e}")
+            logger.error("   Error checking IAM role: %s", e)
             return True  # Don't fail the process for IAM issues
     
-    def destroy_backend_infrastructure(self):
-        """Destroy only the specific backend infrastructure from deployment file"""
-        print("🎯 PRECISE BACKEND DESTRUCTION")
-        print("This will ONLY destroy resources listed in the deployment JSON file:")
-        print(f"   File: {self.backend_file}")
+    def _role_attachments(self, role_name):
+        """Return the policies and instance profiles of a role, listed once per destroyer"""
+        if role_name not in self._role_state:
+            self._role_state[role_name] = {
+                'policies': self.iam.get_paginator('list_attached_role_policies').paginate(
+                    RoleName=role_name
+                ).build_full_result()['AttachedPolicies'],
+                'inline_policies': self.iam.get_paginator('list_role_policies').paginate(
+                    RoleName=role_name
+                ).build_full_result()['PolicyNames'],
+                'profiles': self.iam.get_paginator('list_instance_profiles_for_role').paginate(
+                    RoleName=role_name
+                ).build_full_result()['InstanceProfiles']
+            }
+        return self._role_state[role_name]
+    
+    def _delete_role(self, role_name):
+        """Detach everything from an IAM role, then delete it and its instance profiles"""
+        role_state = self._role_attachments(role_name)
+        policies = role_state['policies']
+        inline_policies = role_state['inline_policies']
+        profiles = role_state['profiles']
         
-        if not self.load_backend_info():
+        # Detaches and profile removals are independent of each other
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(
+                lambda policy_name: self.iam.delete_role_policy(RoleName=role_name, PolicyName=policy_name),
+                inline_policies
+            ))
+            list(executor.map(
+                lambda policy: self.iam.detach_role_policy(RoleName=role_name, PolicyArn=policy['PolicyArn']),
+                policies
+            ))
+            list(executor.map(
+                lambda profile: self.iam.remove_role_from_instance_profile(
+                    InstanceProfileName=profile['InstanceProfileName'],
+                    RoleName=role_name
+                ),
+                profiles
+            ))
+            list(executor.map(
+                lambda profile: self.iam.delete_instance_profile(InstanceProfileName=profile['InstanceProfileName']),
+                profiles
+            ))
+        logger.info("   Detached %s policies and removed %s instance profiles", len(policies) + len(inline_policies), len(profiles))
+        
+        # Only wait when IAM has not caught up with the detaches yet
+        for attempt in range(5):
+            try:
+                self.iam.delete_role(RoleName=role_name)
+                logger.info("   IAM role %s deleted", role_name)
+                return True
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'DeleteConflict' or attempt == 4:
+                    raise
+                time.sleep(2 ** attempt)
+    
+    def _has_any_resource(self):
+        """Tell whether the deployment info lists any resource to destroy"""
+        return any(self.resources.values())
+    
+    def _remove_backend_file(self):
+        """Clean up the deployment file"""
+        try:
+            self._backend_path.unlink()
+            logger.info("Removed deployment file: %s", self.backend_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning("Could not remove deployment file: %s", e)
+    
+    def _run_step(self, step_name, step_function):
+        """Run one destruction step, reporting failures instead of raising"""
+        logger.info("STEP: %s", step_name)
+        start = time.perf_counter()
+        
+        try:
+            if not step_function():
+                logger.warning("Step '%s' completed with warnings", step_name)
+                return False
+        except Exception as e:
+            logger.error("Step '%s' failed: %s", step_name, e)
             return False
+        finally:
+            logger.info("Step '%s' took %.2fs", step_name, time.perf_counter() - start)
+        return True
+    
+    def destroy_backend_infrastructure(self, confirm=True):
+        """Destroy only the specific backend infrastructure from deployment file"""
+        logger.info("PRECISE BACKEND DESTRUCTION")
+        logger.info("This will ONLY destroy resources listed in the deployment JSON file:")
+        logger.info("   File: %s", self.backend_file)
         
-        print("\n⚠️  WARNING: This will delete the specific backend infrastructure!")
-        confirmation = input("\nType 'DELETE' to confirm destruction: ")
-        if confirmation != 'DELETE':
-            print("❌ Destruction cancelled")
+        if not self.load_backend_info():
             return False
         
-        print("\n🚀 Starting precise backend infrastructure destruction...")
+        # A re-run after success or a half-written file leaves nothing to spend API calls on
+        if not self._has_any_resource() and not self.delete_iam_role:
+            logger.info("Nothing to destroy")
+            self._remove_backend_file()
+            return True
         
-        # Destruction sequence (order matters due to dependencies)
-        steps = [
-            ("Auto Scaling Group", self.delete_auto_scaling_group),
-            ("Load Balancer", self.delete_load_balancer),
-            ("Target Groups", self.delete_target_groups),
-            ("Launch Template", self.delete_launch_template),
-            ("IAM Role Check", self.cleanup_iam_role)
-        ]
+        if confirm and not confirm_destruction():
+            return False
         
-        overall_success = True
+        logger.info("Starting precise backend infrastructure destruction...")
         
-        for step_name, step_function in steps:
-            print(f"\n{'='*50}")
-            print(f"STEP: {step_name}")
-            print('='*50)
+        # Destruction pipeline (only real dependencies are waited on):
+        #   ASG, ALB and Launch Template are independent and start together
+        #   (the ASG is being force-deleted and launches nothing from the template)
+        #   IAM role only needs the ASG (and its instances) gone
+        #   Target Groups need both the ALB listeners and the ASG gone
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            asg_future = executor.submit(self._run_step, "Auto Scaling Group", self.delete_auto_scaling_group)
+            alb_future = executor.submit(self._run_step, "Load Balancer", self.delete_load_balancer)
+            lt_future = executor.submit(self._run_step, "Launch Template", self.delete_launch_template)
             
-            try:
-                if not step_function():
-                    print(f"⚠️  Step '{step_name}' completed with warnings")
-                    overall_success = False
-            except Exception as e:
-                print(f"❌ Step '{step_name}' failed: {e}")
-                overall_success = False
+            asg_future.result()
+            iam_future = executor.submit(self._run_step, "IAM Role Check", self.cleanup_iam_role)
             
-            # Brief pause between steps
-            time.sleep(3)
-        
-        # Wait for ALB to be fully deleted before declaring success
-        if self.backend_info.get('alb_arn'):
-            self.wait_with_progress(60, "Waiting for Load Balancer to be fully deleted")
+            alb_future.result()
+            tg_future = executor.submit(self._run_step, "Target Groups", self.delete_target_groups)
+            
+            futures = [asg_future, alb_future, lt_future, iam_future, tg_future]
+            overall_success = all(future.result() for future in futures)
         
-        print(f"\n{'='*50}")
+        logger.info("=" * 50)
         if overall_success:
-            print("🎉 Backend infrastructure destruction completed successfully!")
+            logger.info("Backend infrastructure destruction completed successfully!")
         else:
-            print("⚠️  Backend infrastructure destruction completed with some warnings")
-            print("   Check the output above for any issues")
+            logger.warning("Backend infrastructure destruction completed with some warnings")
+            logger.info("   Check the output above for any issues")
         
-        # Clean up the deployment file
-        try:
-            if os.path.exists(self.backend_file):
-                os.remove(self.backend_file)
-                print(f"🗑️  Removed deployment file: {self.backend_file}")
-        except Exception as e:
-            print(f"⚠️  Could not remove deployment file: {e}")
+        self._remove_backend_file()
         
-        print("\n📝 Summary:")
-        print("   ✅ Only resources from deployment file were targeted")
-        print("   ✅ VPC and other infrastructure remains intact")
-        print("   ✅ IAM role preserved (check manually if cleanup needed)")
+        logger.info("Summary:")
+        logger.info("   Only resources from deployment file were targeted")
+        logger.info("   VPC and other infrastructure remains intact")
+        if not self.delete_iam_role:
+            logger.info("   IAM role preserved (check manually if cleanup needed)")
         
         return overall_success
 
 
+def confirm_destruction():
+    """Ask the user to type DELETE before anything is destroyed"""
+    logger.warning("WARNING: This will delete the specific backend infrastructure!")
+    confirmation = input("\nType 'DELETE' to confirm destruction: ")
+    if confirmation != 'DELETE':
+        logger.error("Destruction cancelled")
+        return False
+    return True
+
+
+def destroy_regions(regions, backend_file, delete_iam_role=False):
+    """Destroy the backend of several regions concurrently, returns {region: success}"""
+    def destroy_one_region(region):
+        destroyer = PreciseASGDestroyer(
+            region=region,
+            backend_file=backend_file.format(region=region),
+            delete_iam_role=delete_iam_role
+        )
+        try:
+            return destroyer.destroy_backend_infrastructure(confirm=False)
+        except Exception as e:
+            logger.error("[%s] Unexpected error: %s", region, e)
+            return False
+    
+    # Regions share nothing, so they are destroyed side by side
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        return dict(zip(regions, executor.map(destroy_one_region, regions)))
+
+
 def main():
     """Main function"""
     import argparse
     
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(message)s')
+    
     parser = argparse.ArgumentParser(description='Destroy Specific Backend Infrastructure')
     parser.add_argument('--region', default='ap-south-1', help='AWS region (default: ap-south-1)')
+    parser.add_argument('--regions', help='Comma-separated regions to destroy concurrently (overrides --region)')
     parser.add_argument('--backend-file', default='../Apply/States/Ubuntu-Backend-Deploy-Info.json',
-                       help='Backend deployment info JSON file')
+                       help='Backend deployment info JSON file ({region} is replaced per region)')
     parser.add_argument('--force', action='store_true', help='Skip confirmation prompt')
+    parser.add_argument('--delete-iam-role', action='store_true',
+                       help='Also delete the backend IAM role once no instance uses it')
     
     args = parser.parse_args()
     
-    destroyer = PreciseASGDestroyer(
-        region=args.region,
-        backend_file=args.backend_file
-    )
+    regions = args.regions.split(',') if args.regions else [args.region]
+    if len(regions) > 1 and '{region}' not in args.backend_file:
+        parser.error("--backend-file must contain {region} when destroying several regions")
     
     try:
         if args.force:
-            print("🚀 Force mode: Skipping confirmation")
-            # Mock the confirmation
-            import unittest.mock
-            with unittest.mock.patch('builtins.input', return_value='DELETE'):
-                success = destroyer.destroy_backend_infrastructure()
+            logger.info("Force mode: Skipping confirmation")
+        
+        if len(regions) == 1:
+            # A single region confirms after listing the resources it will destroy
+            destroyer = PreciseASGDestroyer(
+                region=regions[0],
+                backend_file=args.backend_file.format(region=regions[0]),
+                delete_iam_role=args.delete_iam_role
+            )
+            success = destroyer.destroy_backend_infrastructure(confirm=not args.force)
         else:
-            success = destroyer.destroy_backend_infrastructure()
+            if not args.force and not confirm_destruction():
+                return
+            
+            results = destroy_regions(regions, args.backend_file, args.delete_iam_role)
+            for region, region_success in results.items():
+                logger.info("   %s: %s", region, 'done' if region_success else 'completed with warnings')
+            success = all(results.values())
         
         if success:
-            print("\n✅ Precise destruction completed successfully!")
+            logger.info("Precise destruction completed successfully!")
         else:
-            print("\n⚠️  Precise destruction completed with warnings!")
+            logger.warning("Precise destruction completed with warnings!")
             
     except KeyboardInterrupt:
-        print("\n❌ Destruction cancelled by user")
+        logger.error("Destruction cancelled by user")
     except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         import traceback
         traceback.print_exc()
 
@@ -6,41 +6,75 @@ Safely removes VPC, subnets, security groups, and all networking components
 
 import boto3
 import json
+import logging
+import os
+import sys
 import time
-from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
+from botocore.exceptions import ClientError, WaiterError
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+logger = logging.getLogger(__name__)
 
 
 class VPCDestroyer:
+    VPC_FILTER_NAME = 'vpc-id'
+    IGW_FILTER_NAME = 'attachment.vpc-id'
+    
     def __init__(self, region='ap-south-1', vpc_id=None, infrastructure_file='States/VPC-Deploy-Info.json'):
         self.region = region
-        self.ec2 = boto3.client('ec2', region_name=region)
-        self.vpc_id = vpc_id
+        # Adaptive retries absorb RequestLimitExceeded from the concurrent calls, and the
+        # pool is large enough that they never wait on a connection
+        self.client_config = Config(
+            region_name=region,
+            max_pool_connections=50,
+            retries={'mode': 'adaptive', 'max_attempts': 10}
+        )
+        # Clients are built once; they are safe to share between the worker threads
+        # for API calls (only credential refresh is not thread-safe)
+        self.ec2 = boto3.client('ec2', config=self.client_config)
+        self.elbv2 = boto3.client('elbv2', config=self.client_config)
+        self._set_vpc_id(vpc_id)
         self.infrastructure_file = infrastructure_file
         self.infrastructure_info = None
         
+    def _set_vpc_id(self, vpc_id):
+        """Set the VPC to destroy and build the describe filters for it once"""
+        self.vpc_id = vpc_id
+        self._vpc_filters = [{'Name': self.VPC_FILTER_NAME, 'Values': [vpc_id]}]
+        self._igw_filters = [{'Name': self.IGW_FILTER_NAME, 'Values': [vpc_id]}]
+    
     def load_infrastructure_info(self):
         """Load infrastructure information from JSON file"""
         try:
-            with open(self.infrastructure_file, 'r') as f:
-                self.infrastructure_info = json.load(f)
-                self.vpc_id = self.infrastructure_info.get('vpc_id')
-                print(f"✅ Loaded infrastructure info from {self.infrastructure_file}")
-                print(f"📋 VPC ID: {self.vpc_id}")
+            with open(self.infrastructure_file, 'rb') as f:
+                data = f.read()
+                # orjson.JSONDecodeError subclasses json.JSONDecodeError, so one handler covers both
+                self.infrastructure_info = orjson.loads(data) if orjson else json.loads(data)
+                self._set_vpc_id(self.infrastructure_info.get('vpc_id'))
+                logger.info("Loaded infrastructure info from %s", self.infrastructure_file)
+                logger.info("VPC ID: %s", self.vpc_id)
                 return True
         except FileNotFoundError:
-            print(f"⚠️  Infrastructure file {self.infrastructure_file} not found")
+            logger.warning("Infrastructure file %s not found", self.infrastructure_file)
             if self.vpc_id:
-                print(f"📋 Using provided VPC ID: {self.vpc_id}")
+                logger.info("Using provided VPC ID: %s", self.vpc_id)
                 return True
             return False
         except json.JSONDecodeError:
-            print(f"❌ Error reading infrastructure file {self.infrastructure_file}")
+            logger.error("Error reading infrastructure file %s", self.infrastructure_file)
             return False
     
     def get_vpc_resources(self):
         """Discover all resources associated with the VPC"""
         if not self.vpc_id:
-            print("❌ No VPC ID provided")
+            logger.error("No VPC ID provided")
             return None
             
         resources = {
@@ -56,130 +90,156 @@ class VPCDestroyer:
             'endpoints': []
         }
         
+        # resource type: (describe call, its filter parameter, filters). Discovery stays
+        # VPC-wide even with a state file: anything the file does not list would
+        # otherwise survive and make the VPC delete fail with DependencyViolation
+        lookups = {
+            'instances': (self.ec2.describe_instances, 'Filters', self._vpc_filters),
+            # DescribeNatGateways names its filter parameter in the singular
+            'nat_gateways': (self.ec2.describe_nat_gateways, 'Filter', self._vpc_filters),
+            'internet_gateways': (self.ec2.describe_internet_gateways, 'Filters', self._igw_filters),
+            'route_tables': (self.ec2.describe_route_tables, 'Filters', self._vpc_filters),
+            'security_groups': (self.ec2.describe_security_groups, 'Filters', self._vpc_filters),
+            'subnets': (self.ec2.describe_subnets, 'Filters', self._vpc_filters),
+            'endpoints': (self.ec2.describe_vpc_endpoints, 'Filters', self._vpc_filters)
+        }
+        
+        def describe(resource_type):
+            method, filter_param, filters = lookups[resource_type]
+            return method(**{filter_param: filters})
+        
         try:
+            # The describe calls are independent, so they share the client and run concurrently
+            with ThreadPoolExecutor(max_workers=len(lookups)) as executor:
+                responses = dict(zip(lookups, executor.map(describe, lookups)))
+            
             # Get EC2 instances
-            instances_response = self.ec2.describe_instances(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for reservation in instances_response['Reservations']:
+            for reservation in responses['instances']['Reservations']:
                 for instance in reservation['Instances']:
                     if instance['State']['Name'] != 'terminated':
                         resources['instances'].append(instance['InstanceId'])
             
             # Get NAT Gateways
-            nat_response = self.ec2.describe_nat_gateways(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for nat in nat_response['NatGateways']:
+            for nat in responses['nat_gateways']['NatGateways']:
                 if nat['State'] not in ['deleted', 'deleting']:
                     resources['nat_gateways'].append(nat['NatGatewayId'])
             
             # Get Internet Gateways
-            igw_response = self.ec2.describe_internet_gateways(
-                Filters=[{'Name': 'attachment.vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for igw in igw_response['InternetGateways']:
+            for igw in responses['internet_gateways']['InternetGateways']:
                 resources['internet_gateways'].append(igw['InternetGatewayId'])
             
             # Get Route Tables (exclude main route table)
-            rt_response = self.ec2.describe_route_tables(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for rt in rt_response['RouteTables']:
+            for rt in responses['route_tables']['RouteTables']:
                 # Skip main route table
                 is_main = any(assoc.get('Main', False) for assoc in rt.get('Associations', []))
                 if not is_main:
                     resources['route_tables'].append(rt['RouteTableId'])
             
             # Get Security Groups (exclude default)
-            sg_response = self.ec2.describe_security_groups(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for sg in sg_response['SecurityGroups']:
+            for sg in responses['security_groups']['SecurityGroups']:
                 if sg['GroupName'] != 'default':
                     resources['security_groups'].append(sg['GroupId'])
             
             # Get Subnets
-            subnet_response = self.ec2.describe_subnets(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for subnet in subnet_response['Subnets']:
+            for subnet in responses['subnets']['Subnets']:
                 resources['subnets'].append(subnet['SubnetId'])
             
             # Get VPC Endpoints
-            endpoint_response = self.ec2.describe_vpc_endpoints(
-                Filters=[{'Name': 'vpc-id', 'Values': [self.vpc_id]}]
-            )
-            for endpoint in endpoint_response['VpcEndpoints']:
-                if endpoint['State'] not in ['deleted', 'deleting']:
+            for endpoint in responses['endpoints']['VpcEndpoints']:
+                # Endpoint states are capitalized ('Deleting', 'Deleted')
+                if endpoint['State'].lower() not in ['deleted', 'deleting']:
                     resources['endpoints'].append(endpoint['VpcEndpointId'])
             
-            print(f"📋 Discovered VPC resources:")
+            logger.info("Discovered VPC resources:")
             for resource_type, resource_list in resources.items():
                 if resource_list:
-                    print(f"   {resource_type}: {len(resource_list)} items")
+                    logger.info("   %s: %s items", resource_type, len(resource_list))
             
             return resources
             
         except ClientError as e:
-            print(f"❌ Error discovering VPC resources: {e}")
+            logger.error("Error discovering VPC resources: %s", e)
             return None
     
     def terminate_instances(self, instance_ids):
         """Terminate EC2 instances"""
         if not instance_ids:
-            print("ℹ️  No EC2 instances to terminate")
+            logger.info("No EC2 instances to terminate")
             return True
             
         try:
-            print(f"🔄 Terminating {len(instance_ids)} EC2 instances...")
+            logger.info("Terminating %s EC2 instances...", len(instance_ids))
             self.ec2.terminate_instances(InstanceIds=instance_ids)
             
-            # Wait for instances to terminate
-            print("⏳ Waiting for instances to terminate...")
+            # Wait for instances to terminate, polling often since describe_instances is cheap
+            logger.info("Waiting for instances to terminate...")
             waiter = self.ec2.get_waiter('instance_terminated')
-            waiter.wait(InstanceIds=instance_ids)
+            waiter.wait(
+                InstanceIds=instance_ids,
+                WaiterConfig={'Delay': 5, 'MaxAttempts': 120}
+            )
             
-            print(f"✅ Successfully terminated {len(instance_ids)} instances")
+            logger.info("Successfully terminated %s instances", len(instance_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error terminating instances: {e}")
+            logger.error("Error terminating instances: %s", e)
             return False
     
     def delete_load_balancers(self):
         """Delete Application Load Balancers"""
         try:
-            # Use ELBv2 client for Application Load Balancers
-            elbv2 = boto3.client('elbv2', region_name=self.region)
-            
-            # Get load balancers in the VPC
-            response = elbv2.describe_load_balancers()
-            vpc_load_balancers = []
-            
-            for lb in response['LoadBalancers']:
-                if lb.get('VpcId') == self.vpc_id:
-                    vpc_load_balancers.append(lb['LoadBalancerArn'])
+            vpc_load_balancers = self._find_vpc_load_balancers()
             
             if not vpc_load_balancers:
-                print("ℹ️  No load balancers to delete")
+                logger.info("No load balancers to delete")
                 return True
             
             for lb_arn in vpc_load_balancers:
-                print(f"🔄 Deleting load balancer: {lb_arn}")
-                elbv2.delete_load_balancer(LoadBalancerArn=lb_arn)
+                logger.info("Deleting load balancer: %s", lb_arn)
+                self.elbv2.delete_load_balancer(LoadBalancerArn=lb_arn)
+            
+            # Their network interfaces hold on to the subnets and security groups until they are gone
+            logger.info("Waiting for load balancers to be deleted...")
+            try:
+                waiter = self.elbv2.get_waiter('load_balancers_deleted')
+                waiter.wait(
+                    LoadBalancerArns=vpc_load_balancers,
+                    WaiterConfig={'Delay': 5, 'MaxAttempts': 60}
+                )
+            except WaiterError as e:
+                logger.warning("Load balancers still deleting: %s", e)
             
-            print(f"✅ Successfully deleted {len(vpc_load_balancers)} load balancers")
+            logger.info("Successfully deleted %s load balancers", len(vpc_load_balancers))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting load balancers: {e}")
+            logger.error("Error deleting load balancers: %s", e)
             return False
     
+    def _find_vpc_load_balancers(self):
+        """Return the ARNs of the load balancers in the VPC"""
+        return self.load_balancers_by_vpc(self.elbv2, [self.vpc_id])[self.vpc_id]
+    
+    @staticmethod
+    def load_balancers_by_vpc(elbv2, vpc_ids):
+        """Return {vpc_id: [load balancer ARNs]} from a single scan of the region"""
+        # The API has no VPC filter, so every page is read (in pages of 400
+        # rather than a single truncated page) and grouped here. The scan is
+        # fresh on every call; pass all VPC IDs at once to share it
+        pages = elbv2.get_paginator('describe_load_balancers').paginate(
+            PaginationConfig={'PageSize': 400}
+        )
+        grouped = {}
+        for page in pages:
+            for lb in page['LoadBalancers']:
+                grouped.setdefault(lb.get('VpcId'), []).append(lb['LoadBalancerArn'])
+        return {vpc_id: grouped.get(vpc_id, []) for vpc_id in vpc_ids}
+    
     def delete_nat_gateways(self, nat_gateway_ids):
         """Delete NAT Gateways and release associated Elastic IPs"""
         if not nat_gateway_ids:
-            print("ℹ️  No NAT gateways to delete")
+            logger.info("No NAT gateways to delete")
             return True
             
         try:
@@ -194,201 +254,306 @@ class VPCDestroyer:
             
             # Delete NAT Gateways
             for nat_id in nat_gateway_ids:
-                print(f"🔄 Deleting NAT Gateway: {nat_id}")
+                logger.info("Deleting NAT Gateway: %s", nat_id)
                 self.ec2.delete_nat_gateway(NatGatewayId=nat_id)
             
             # Wait for NAT Gateways to be deleted
-            print("⏳ Waiting for NAT Gateways to be deleted...")
+            logger.info("Waiting for NAT Gateways to be deleted...")
             waiter = self.ec2.get_waiter('nat_gateway_deleted')
             waiter.wait(NatGatewayIds=nat_gateway_ids)
             
-            # Release Elastic IPs
-            for eip_id in elastic_ips:
-                try:
-                    print(f"🔄 Releasing Elastic IP: {eip_id}")
-                    self.ec2.release_address(AllocationId=eip_id)
-                except ClientError as e:
-                    print(f"⚠️  Could not release Elastic IP {eip_id}: {e}")
+            # Release Elastic IPs; there is no batch API, but the releases are independent
+            if elastic_ips:
+                with ThreadPoolExecutor(max_workers=len(elastic_ips)) as executor:
+                    list(executor.map(self._release_address, elastic_ips))
             
-            print(f"✅ Successfully deleted {len(nat_gateway_ids)} NAT gateways")
+            logger.info("Successfully deleted %s NAT gateways", len(nat_gateway_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting NAT gateways: {e}")
+            logger.error("Error deleting NAT gateways: %s", e)
             return False
     
+    def _release_address(self, eip_id):
+        """Release one Elastic IP, tolerating one that is already released"""
+        try:
+            logger.info("Releasing Elastic IP: %s", eip_id)
+            self.ec2.release_address(AllocationId=eip_id)
+        except ClientError as e:
+            logger.warning("Could not release Elastic IP %s: %s", eip_id, e)
+    
     def delete_vpc_endpoints(self, endpoint_ids):
         """Delete VPC Endpoints"""
         if not endpoint_ids:
-            print("ℹ️  No VPC endpoints to delete")
+            logger.info("No VPC endpoints to delete")
             return True
             
         try:
             for endpoint_id in endpoint_ids:
-                print(f"🔄 Deleting VPC endpoint: {endpoint_id}")
-                self.ec2.delete_vpc_endpoint(VpcEndpointId=endpoint_id)
+                logger.info("Deleting VPC endpoint: %s", endpoint_id)
+            response = self.ec2.delete_vpc_endpoints(VpcEndpointIds=endpoint_ids)
+            for failure in response.get('Unsuccessful', []):
+                logger.error("Could not delete VPC endpoint %s: %s", failure['ResourceId'], failure['Error']['Message'])
+            if response.get('Unsuccessful'):
+                return False
+            
+            # Interface endpoints hold network interfaces in the subnets and security groups
+            # until they are gone, so wait for that instead of a fixed pause
+            logger.info("Waiting for VPC endpoints to be deleted...")
+            if not self._wait_for_vpc_endpoints_deleted(endpoint_ids):
+                logger.warning("VPC endpoints still deleting")
             
-            print(f"✅ Successfully deleted {len(endpoint_ids)} VPC endpoints")
+            logger.info("Successfully deleted %s VPC endpoints", len(endpoint_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting VPC endpoints: {e}")
+            logger.error("Error deleting VPC endpoints: %s", e)
             return False
     
+    def _wait_for_vpc_endpoints_deleted(self, endpoint_ids, delay=5, max_attempts=60):
+        """Poll until every endpoint is deleted (EC2 ships no waiter for this)"""
+        for _ in range(max_attempts):
+            try:
+                response = self.ec2.describe_vpc_endpoints(VpcEndpointIds=endpoint_ids)
+            except ClientError as e:
+                if e.response['Error']['Code'] == 'InvalidVpcEndpointId.NotFound':
+                    return True
+                raise
+            if all(endpoint['State'].lower() == 'deleted' for endpoint in response['VpcEndpoints']):
+                return True
+            time.sleep(delay)
+        return False
+    
     def delete_route_tables(self, route_table_ids):
         """Delete route tables"""
         if not route_table_ids:
-            print("ℹ️  No custom route tables to delete")
+            logger.info("No custom route tables to delete")
             return True
             
         try:
+            # Describe every route table in one call instead of once per table
+            rt_response = self.ec2.describe_route_tables(RouteTableIds=route_table_ids)
+            route_tables = {rt['RouteTableId']: rt for rt in rt_response['RouteTables']}
+            
+            # First, disassociate all subnets (across every table at once)
+            association_ids = []
             for rt_id in route_table_ids:
-                # First, disassociate all subnets
-                rt_response = self.ec2.describe_route_tables(RouteTableIds=[rt_id])
-                route_table = rt_response['RouteTables'][0]
-                
-                for association in route_table.get('Associations', []):
+                for association in route_tables[rt_id].get('Associations', []):
                     if not association.get('Main', False) and 'RouteTableAssociationId' in association:
-                        print(f"🔄 Disassociating route table {rt_id} from subnet")
-                        self.ec2.disassociate_route_table(
-                            AssociationId=association['RouteTableAssociationId']
-                        )
+                        logger.info("Disassociating route table %s from subnet", rt_id)
+                        association_ids.append(association['RouteTableAssociationId'])
+            
+            with ThreadPoolExecutor(max_workers=10) as executor:
+                list(executor.map(
+                    lambda association_id: self._with_backoff(
+                        self.ec2.disassociate_route_table, AssociationId=association_id
+                    ),
+                    association_ids
+                ))
                 
-                # Delete the route table
-                print(f"🔄 Deleting route table: {rt_id}")
-                self.ec2.delete_route_table(RouteTableId=rt_id)
-            
-            print(f"✅ Successfully deleted {len(route_table_ids)} route tables")
+                # Delete the route tables
+                for rt_id in route_table_ids:
+                    logger.info("Deleting route table: %s", rt_id)
+                list(executor.map(
+                    lambda rt_id: self._with_backoff(self.ec2.delete_route_table, RouteTableId=rt_id),
+                    route_table_ids
+                ))
+            
+            logger.info("Successfully deleted %s route tables", len(route_table_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting route tables: {e}")
+            logger.error("Error deleting route tables: %s", e)
             return False
     
     def delete_security_groups(self, security_group_ids):
         """Delete security groups"""
         if not security_group_ids:
-            print("ℹ️  No custom security groups to delete")
+            logger.info("No custom security groups to delete")
             return True
             
         try:
-            # First, remove all rules to avoid dependency issues
-            for sg_id in security_group_ids:
-                try:
-                    sg_response = self.ec2.describe_security_groups(GroupIds=[sg_id])
-                    sg = sg_response['SecurityGroups'][0]
-                    
-                    # Remove ingress rules
-                    if sg['IpPermissions']:
-                        self.ec2.revoke_security_group_ingress(
-                            GroupId=sg_id,
-                            IpPermissions=sg['IpPermissions']
-                        )
-                    
-                    # Remove egress rules
-                    if sg['IpPermissionsEgress']:
-                        self.ec2.revoke_security_group_egress(
-                            GroupId=sg_id,
-                            IpPermissions=sg['IpPermissionsEgress']
-                        )
-                        
-                except ClientError as e:
-                    print(f"⚠️  Could not remove rules from security group {sg_id}: {e}")
-            
-            # Now delete the security groups
-            for sg_id in security_group_ids:
-                print(f"🔄 Deleting security group: {sg_id}")
-                self.ec2.delete_security_group(GroupId=sg_id)
-            
-            print(f"✅ Successfully deleted {len(security_group_ids)} security groups")
+            # Describe every security group in one call instead of once per group
+            sg_response = self.ec2.describe_security_groups(GroupIds=security_group_ids)
+            security_groups = {sg['GroupId']: sg for sg in sg_response['SecurityGroups']}
+            
+            # First, remove all rules to avoid dependency issues; groups only reference each
+            # other through rules, so within each phase they are handled concurrently
+            with ThreadPoolExecutor(max_workers=min(10, len(security_group_ids))) as executor:
+                list(executor.map(
+                    lambda sg_id: self._revoke_security_group_rules(sg_id, security_groups[sg_id]),
+                    security_group_ids
+                ))
+                
+                # Now delete the security groups
+                list(executor.map(self._delete_security_group, security_group_ids))
+            
+            logger.info("Successfully deleted %s security groups", len(security_group_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting security groups: {e}")
+            logger.error("Error deleting security groups: %s", e)
             return False
     
+    def _revoke_security_group_rules(self, sg_id, sg):
+        """Remove every ingress and egress rule of a security group"""
+        try:
+            # Remove ingress rules
+            if sg['IpPermissions']:
+                self.ec2.revoke_security_group_ingress(
+                    GroupId=sg_id,
+                    IpPermissions=sg['IpPermissions']
+                )
+            
+            # Remove egress rules
+            if sg['IpPermissionsEgress']:
+                self.ec2.revoke_security_group_egress(
+                    GroupId=sg_id,
+                    IpPermissions=sg['IpPermissionsEgress']
+                )
+                
+        except ClientError as e:
+            logger.warning("Could not remove rules from security group %s: %s", sg_id, e)
+    
+    def _delete_security_group(self, sg_id):
+        """Delete a security group, backing off while its network interfaces are released"""
+        logger.info("Deleting security group: %s", sg_id)
+        self._with_backoff(self.ec2.delete_security_group, GroupId=sg_id)
+    
+    def _with_backoff(self, operation, **kwargs):
+        """Call an EC2 operation, retrying DependencyViolation with 1, 2, 4, 8s backoff"""
+        for attempt in range(5):
+            try:
+                return operation(**kwargs)
+            except ClientError as e:
+                if e.response['Error']['Code'] != 'DependencyViolation' or attempt == 4:
+                    raise
+                time.sleep(2 ** attempt)
+    
     def delete_subnets(self, subnet_ids):
         """Delete subnets"""
         if not subnet_ids:
-            print("ℹ️  No subnets to delete")
+            logger.info("No subnets to delete")
             return True
             
         try:
+            # Subnets are independent of each other, delete them concurrently
             for subnet_id in subnet_ids:
-                print(f"🔄 Deleting subnet: {subnet_id}")
-                self.ec2.delete_subnet(SubnetId=subnet_id)
-            
-            print(f"✅ Successfully deleted {len(subnet_ids)} subnets")
+                logger.info("Deleting subnet: %s", subnet_id)
+            with ThreadPoolExecutor(max_workers=min(10, len(subnet_ids))) as executor:
+                list(executor.map(
+                    lambda subnet_id: self._with_backoff(self.ec2.delete_subnet, SubnetId=subnet_id),
+                    subnet_ids
+                ))
+            
+            logger.info("Successfully deleted %s subnets", len(subnet_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting subnets: {e}")
+            logger.error("Error deleting subnets: %s", e)
             return False
     
     def detach_and_delete_internet_gateways(self, igw_ids):
         """Detach and delete Internet Gateways"""
         if not igw_ids:
-            print("ℹ️  No internet gateways to delete")
+            logger.info("No internet gateways to delete")
             return True
             
         try:
             for igw_id in igw_ids:
                 # Detach from VPC
-                print(f"🔄 Detaching Internet Gateway {igw_id} from VPC {self.vpc_id}")
+                logger.info("Detaching Internet Gateway %s from VPC %s", igw_id, self.vpc_id)
                 self.ec2.detach_internet_gateway(
                     InternetGatewayId=igw_id,
                     VpcId=self.vpc_id
                 )
                 
+                # Detach can return before the attachment is really gone, which makes the delete fail
+                if not self._wait_for_igw_detached(igw_id):
+                    logger.warning("Internet Gateway %s still attached, trying to delete anyway", igw_id)
+                
                 # Delete Internet Gateway
-                print(f"🔄 Deleting Internet Gateway: {igw_id}")
+                logger.info("Deleting Internet Gateway: %s", igw_id)
                 self.ec2.delete_internet_gateway(InternetGatewayId=igw_id)
             
-            print(f"✅ Successfully deleted {len(igw_ids)} internet gateways")
+            logger.info("Successfully deleted %s internet gateways", len(igw_ids))
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting internet gateways: {e}")
+            logger.error("Error deleting internet gateways: %s", e)
             return False
     
+    def _wait_for_igw_detached(self, igw_id, timeout=60):
+        """Poll until the Internet Gateway reports no attachments"""
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            response = self.ec2.describe_internet_gateways(InternetGatewayIds=[igw_id])
+            if not response['InternetGateways'][0].get('Attachments'):
+                return True
+            time.sleep(1)
+        return False
+    
     def delete_vpc(self):
         """Delete the VPC"""
         if not self.vpc_id:
-            print("❌ No VPC ID to delete")
+            logger.error("No VPC ID to delete")
             return False
             
         try:
-            print(f"🔄 Deleting VPC: {self.vpc_id}")
+            logger.info("Deleting VPC: %s", self.vpc_id)
             self.ec2.delete_vpc(VpcId=self.vpc_id)
-            print(f"✅ Successfully deleted VPC: {self.vpc_id}")
+            logger.info("Successfully deleted VPC: %s", self.vpc_id)
             return True
             
         except ClientError as e:
-            print(f"❌ Error deleting VPC: {e}")
+            logger.error("Error deleting VPC: %s", e)
+            return False
+    
+    def _run_step(self, step_name, step_function):
+        """Run one destruction step and report if it failed"""
+        logger.info("Step: %s", step_name)
+        if not step_function():
+            logger.error("Failed at step: %s", step_name)
             return False
+        return True
     
     def destroy_infrastructure(self, confirm=True):
         """Destroy all VPC infrastructure"""
         if confirm:
-            print("⚠️  WARNING: This will delete ALL resources in the VPC!")
-            print(f"VPC ID: {self.vpc_id}")
-            confirmation = input("Type 'DELETE' to confirm destruction: ")
+            logger.warning("WARNING: This will delete ALL resources in the VPC!")
+            logger.info("VPC ID: %s", self.vpc_id)
+            if sys.stdin.isatty():
+                confirmation = input("Type 'DELETE' to confirm destruction: ")
+            else:
+                # No one to prompt in a pipeline, the confirmation has to come from the environment
+                confirmation = os.environ.get('DESTROY_CONFIRM')
+                if confirmation != 'DELETE':
+                    logger.info("Not running in a terminal: set DESTROY_CONFIRM=DELETE or use --force")
             if confirmation != 'DELETE':
-                print("❌ Destruction cancelled")
+                logger.error("Destruction cancelled")
                 return False
         
-        print("🚀 Starting VPC infrastructure destruction...")
+        logger.info("Starting VPC infrastructure destruction...")
         
         # Get all VPC resources
         resources = self.get_vpc_resources()
         if not resources:
             return False
         
-        # Delete in the correct order to handle dependencies
-        steps = [
+        # Instances, load balancers and endpoints are independent of each other, so they are
+        # deleted (and waited for) side by side before anything that depends on them
+        parallel_steps = [
             ("EC2 Instances", lambda: self.terminate_instances(resources['instances'])),
             ("Load Balancers", lambda: self.delete_load_balancers()),
-            ("VPC Endpoints", lambda: self.delete_vpc_endpoints(resources['endpoints'])),
+            ("VPC Endpoints", lambda: self.delete_vpc_endpoints(resources['endpoints']))
+        ]
+        with ThreadPoolExecutor(max_workers=len(parallel_steps)) as executor:
+            results = list(executor.map(lambda step: self._run_step(*step), parallel_steps))
+        if not all(results):
+            return False
+        
+        # Delete the rest in the correct order to handle dependencies
+        steps = [
             ("NAT Gateways", lambda: self.delete_nat_gateways(resources['nat_gateways'])),
             ("Route Tables", lambda: self.delete_route_tables(resources['route_tables'])),
             ("Security Groups", lambda: self.delete_security_groups(resources['security_groups'])),
@@ -397,23 +562,20 @@ class VPCDestroyer:
             ("VPC", lambda: self.delete_vpc())
         ]
         
+        # Each step waits for the state its successors depend on, so no pause is needed
         for step_name, step_function in steps:
-            print(f"\n🔄 Step: {step_name}")
-            if not step_function():
-                print(f"❌ Failed at step: {step_name}")
+            if not self._run_step(step_name, step_function):
                 return False
-            time.sleep(2)  # Brief pause between steps
         
-        print("\n🎉 VPC Infrastructure destruction completed successfully!")
+        logger.info("VPC Infrastructure destruction completed successfully!")
         
         # Clean up infrastructure file
         try:
-            import os
             if os.path.exists(self.infrastructure_file):
                 os.remove(self.infrastructure_file)
-                print(f"🗑️  Removed infrastructure file: {self.infrastructure_file}")
+                logger.info("Removed infrastructure file: %s", self.infrastructure_file)
         except Exception as e:
-            print(f"⚠️  Could not remove infrastructure file: {e}")
+            logger.warning("Could not remove infrastructure file: %s", e)
         
         return True
 
@@ -422,6 +584,9 @@ def main():
     """Main function to destroy VPC infrastructure"""
     import argparse
     
+    # The thread name tells the concurrent destroy steps apart
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(threadName)s %(message)s')
+    
     parser = argparse.ArgumentParser(description='Destroy AWS VPC Infrastructure')
     parser.add_argument('--vpc-id', help='VPC ID to destroy')
     parser.add_argument('--region', default='ap-south-1', help='AWS region')
@@ -442,19 +607,19 @@ def main():
         # Load infrastructure info
         if not destroyer.load_infrastructure_info():
             if not args.vpc_id:
-                print("❌ No VPC ID provided and no infrastructure file found")
-                print("Use --vpc-id parameter or ensure infrastructure_info.json exists")
+                logger.error("No VPC ID provided and no infrastructure file found")
+                logger.info("Use --vpc-id parameter or ensure infrastructure_info.json exists")
                 return
         
         # Destroy infrastructure
         success = destroyer.destroy_infrastructure(confirm=not args.force)
         if success:
-            print("\n✅ All infrastructure components destroyed successfully!")
+            logger.info("All infrastructure components destroyed successfully!")
         else:
-            print("\n❌ Infrastructure destruction failed!")
+            logger.error("Infrastructure destruction failed!")
             
     except Exception as e:
-        print(f"❌ Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
 
 
 if __name__ == "__main__":